@@ -0,0 +1,144 @@
+# -- Принцип работы --
+#
+# Потоковый вариант решения из `a.py` для улиц с очень большим числом домов. Расстояние от каждого
+# дома до ближайшего пустого участка зависит только от положения соседних нулей, поэтому сами номера
+# домов в памяти не хранятся. Входная строка считывается блоками фиксированного размера, каждый блок
+# разбивается на токены, и позиции нулей в нем находятся вызовами `list.index()`. Между блоками
+# сохраняется только количество домов, прошедших после последнего найденного нуля.
+#
+# Как только найден очередной нуль, расстояния для всех домов отрезка перед ним известны заранее:
+#
+# * перед первым нулем расстояния убывают: `L, L - 1, ..., 1`;
+# * между двумя нулями они сначала возрастают, а затем убывают: `1, 2, ..., 2, 1`;
+# * после последнего нуля расстояния возрастают: `1, 2, ..., L`.
+#
+# Такие отрезки формируются целиком из диапазонов `range()` и записываются в стандартный вывод
+# крупными блоками байтов.
+#
+# -- Временная сложность --
+#
+# Каждый токен входных данных и каждое число результата обрабатываются за константное время, поэтому
+# временная сложность составляет `O(n)`.
+#
+# -- Пространственная сложность --
+#
+# В памяти одновременно хранятся только текущий блок входных данных и буфер вывода, поэтому
+# пространственная сложность составляет `O(block_size)`.
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from typing import BinaryIO
+
+BLOCK_SIZE = 1 << 20
+PIECE_SIZE = 1 << 16
+
+ZERO = b'0'
+
+
+def read_token_blocks(stream: BinaryIO,
+                      *,
+                      tokens_count: int,
+                      block_size: int = BLOCK_SIZE) -> Iterator[Sequence[bytes]]:
+    tail = b''
+
+    while tokens_count > 0:
+        data = stream.read(block_size)
+
+        if not data:
+            break
+
+        tokens = (tail + data).split()
+        tail = b''
+
+        if tokens and not data[-1:].isspace():
+            tail = tokens.pop()
+
+        tokens = tokens[:tokens_count]
+        tokens_count -= len(tokens)
+
+        if tokens:
+            yield tokens
+
+    if tail and tokens_count > 0:
+        yield [tail]
+
+
+def get_distances_to_zero(token_blocks: Iterable[Sequence[bytes]]) -> Iterator[bytes]:
+    houses_count = 0
+    has_zero = False
+
+    for tokens in token_blocks:
+        pos = 0
+
+        while True:
+            try:
+                zero_pos = tokens.index(ZERO, pos)
+            except ValueError:
+                break
+
+            houses_count += zero_pos - pos
+
+            if has_zero:
+                yield from _format_between_zeros(houses_count)
+            else:
+                yield from _format_range(houses_count, 0, -1)
+
+            yield ZERO
+
+            houses_count = 0
+            has_zero = True
+            pos = zero_pos + 1
+
+        houses_count += len(tokens) - pos
+
+    if has_zero:
+        yield from _format_range(1, houses_count + 1, 1)
+
+
+def write_distances(distances: Iterable[bytes], stream: BinaryIO, *, buffer_size: int = BLOCK_SIZE) -> None:
+    buffer: list[bytes] = []
+    buffer_length = 0
+    separator = b''
+
+    for piece in distances:
+        buffer.append(piece)
+        buffer_length += len(piece)
+
+        if buffer_length >= buffer_size:
+            stream.write(separator + b' '.join(buffer))
+            separator = b' '
+            buffer.clear()
+            buffer_length = 0
+
+    if buffer:
+        stream.write(separator + b' '.join(buffer))
+
+    stream.write(b'\n')
+
+
+def _format_between_zeros(houses_count: int) -> Iterator[bytes]:
+    yield from _format_range(1, (houses_count + 1) // 2 + 1, 1)
+    yield from _format_range(houses_count // 2, 0, -1)
+
+
+def _format_range(start: int, stop: int, step: int) -> Iterator[bytes]:
+    for piece_start in range(start, stop, step * PIECE_SIZE):
+        piece_stop = piece_start + step * PIECE_SIZE
+
+        if (piece_stop - stop) * step > 0:
+            piece_stop = stop
+
+        yield ' '.join(map(str, range(piece_start, piece_stop, step))).encode()
+
+
+def main() -> None:
+    numbers_count = int(sys.stdin.buffer.readline().strip())
+    token_blocks = read_token_blocks(sys.stdin.buffer, tokens_count=numbers_count)
+
+    write_distances(get_distances_to_zero(token_blocks), sys.stdout.buffer)
+
+
+if __name__ == '__main__':
+    main()
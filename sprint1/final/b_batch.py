@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from typing import BinaryIO
+
+type GridRecord = tuple[int, bytes]
+
+DIGITS = b'123456789'
+EMPTY_CELL = b'.'
+EMPTY_CELLS_TABLE = bytes(byte if byte in DIGITS else ord(EMPTY_CELL) for byte in range(256))
+
+
+def get_max_scores(records: Iterable[GridRecord], *, players_count: int = 2) -> Sequence[int]:
+    result: list[int] = []
+    append_result = result.append
+    empty_cell = ord(EMPTY_CELL)
+
+    for max_keys, grid in records:
+        total_max_keys = max_keys * players_count
+        grid_digits = set(grid)
+        grid_digits.discard(empty_cell)
+
+        if total_max_keys >= len(grid):
+            append_result(len(grid_digits))
+            continue
+
+        append_result(sum(
+            grid.count(digit) <= total_max_keys
+            for digit in grid_digits
+        ))
+
+    return result
+
+
+def read_grids(stream: BinaryIO, *, width: int = 4, height: int = 4) -> Iterator[GridRecord]:
+    tokens = stream.read().split()
+    record_size = height + 1
+    records_count = len(tokens) // record_size
+    del tokens[records_count * record_size:]
+
+    max_keys_list = list(map(int, tokens[0::record_size]))
+    del tokens[0::record_size]
+
+    grid_size = width * height
+
+    # Строки проверяются по отдельности: при сверке только общей длины длинная и короткая строки
+    # могли бы компенсировать друг друга.
+    if all(len(row) == width for row in tokens):
+        grids_data = b''.join(tokens)
+    else:
+        grids_data = b''.join(row[:width].ljust(width, EMPTY_CELL) for row in tokens)
+
+    grids_data = grids_data.translate(EMPTY_CELLS_TABLE)
+
+    for i, max_keys in enumerate(max_keys_list):
+        yield max_keys, grids_data[i * grid_size:(i + 1) * grid_size]
+
+
+def main() -> None:
+    max_scores = get_max_scores(read_grids(sys.stdin.buffer))
+    sys.stdout.write(''.join(f'{max_score}\n' for max_score in max_scores))
+
+
+if __name__ == '__main__':
+    main()
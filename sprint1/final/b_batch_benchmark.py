@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import io
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+import b
+import b_batch
+
+
+def generate_grids_data(grids_count: int) -> bytes:
+    lines: list[str] = []
+
+    for i in range(grids_count):
+        lines.append(str(random.randint(1, 5)))
+
+        for y in range(4):
+            lines.append(''.join(random.choice('.123456789') for x in range(4)))
+
+    return '\n'.join(lines).encode()
+
+
+def get_max_scores_per_grid(grids_data: bytes) -> Sequence[int]:
+    lines = grids_data.decode().split()
+    result: list[int] = []
+
+    for pos in range(0, len(lines), 5):
+        grid = (
+            (None if char == '.' else int(char) for char in row)
+            for row in lines[pos + 1:pos + 5]
+        )
+        result.append(b.get_max_score(grid, max_keys=int(lines[pos])))
+
+    return result
+
+
+def measure(name: str, grids_count: int, function: Callable[[], Sequence[int]]) -> Sequence[int]:
+    start_time = time.perf_counter()
+    result = function()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f'{name:<20} {elapsed_time:8.3f} s {grids_count / elapsed_time / 1e6:8.2f} M grids/s')
+
+    return result
+
+
+def main() -> None:
+    grids_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 5
+    grids_data = generate_grids_data(grids_count)
+
+    result_per_grid = measure('get_max_score()', grids_count, lambda: get_max_scores_per_grid(grids_data))
+    result_batch = measure('get_max_scores()', grids_count, lambda: b_batch.get_max_scores(
+        b_batch.read_grids(io.BytesIO(grids_data)),
+    ))
+
+    assert list(result_per_grid) == list(result_batch)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import array
+import mmap
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Self
+
+INT64_SIZE = 8
+
+
+class DenseMatrix:
+    elements: Sequence[int]
+    rows_count: int
+    columns_count: int
+    offset: int
+    row_stride: int
+    column_stride: int
+
+    _mmap: mmap.mmap | None
+
+    def __init__(self,
+                 elements: Sequence[int],
+                 *,
+                 rows_count: int,
+                 columns_count: int,
+                 offset: int = 0,
+                 row_stride: int | None = None,
+                 column_stride: int = 1) -> None:
+        self.elements = elements
+        self.rows_count = rows_count
+        self.columns_count = columns_count
+        self.offset = offset
+        self.row_stride = columns_count if row_stride is None else row_stride
+        self.column_stride = column_stride
+
+        self._mmap = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __getitem__(self, position: tuple[int, int]) -> int:
+        row, column = position
+
+        if not self.is_valid_element(row, column):
+            raise IndexError('Matrix index out of range')
+
+        return self.elements[self.offset + row * self.row_stride + column * self.column_stride]
+
+    def __str__(self) -> str:
+        return '\n'.join(' '.join(map(str, elements_row)) for elements_row in self.iter_rows())
+
+    def close(self) -> None:
+        if self._mmap is None:
+            return
+
+        if isinstance(self.elements, memoryview):
+            self.elements.release()
+
+        self.elements = array.array('q')
+        self._mmap.close()
+        self._mmap = None
+
+    def is_valid_element(self, row: int, column: int) -> bool:
+        return (
+                0 <= row < self.rows_count and
+                0 <= column < self.columns_count
+        )
+
+    def iter_rows(self) -> Iterator[Sequence[int]]:
+        for row in range(self.rows_count):
+            row_start = self.offset + row * self.row_stride
+            row_stop = row_start + self.columns_count * self.column_stride
+
+            yield self.elements[row_start:row_stop:self.column_stride]
+
+    def transpose(self) -> Self:
+        return self.__class__(
+            self.elements,
+            rows_count=self.columns_count,
+            columns_count=self.rows_count,
+            offset=self.offset,
+            row_stride=self.column_stride,
+            column_stride=self.row_stride,
+        )
+
+    def get_neighbours(self, row: int, column: int) -> Sequence[int]:
+        if not self.is_valid_element(row, column):
+            return []
+
+        elements = self.elements
+        index = self.offset + row * self.row_stride + column * self.column_stride
+        result: list[int] = []
+
+        if row > 0:
+            result.append(elements[index - self.row_stride])
+
+        if row < self.rows_count - 1:
+            result.append(elements[index + self.row_stride])
+
+        if column > 0:
+            result.append(elements[index - self.column_stride])
+
+        if column < self.columns_count - 1:
+            result.append(elements[index + self.column_stride])
+
+        result.sort()
+
+        return result
+
+    def neighbours(self, rows: Iterable[int], columns: Iterable[int]) -> Sequence[Sequence[int]]:
+        get_neighbours = self.get_neighbours
+        return [get_neighbours(row, column) for row, column in zip(rows, columns, strict=True)]
+
+    def to_file(self, path: str) -> None:
+        with open(path, 'wb') as matrix_file:
+            for elements_row in self.iter_rows():
+                array.array('q', elements_row).tofile(matrix_file)
+
+    @classmethod
+    def from_rows(cls, elements: Iterable[Iterable[int]], *, columns_count: int) -> Self:
+        elements_array = array.array('q')
+
+        for elements_row in elements:
+            elements_array.extend(elements_row)
+
+        if len(elements_array) % columns_count:
+            raise ValueError('Invalid matrix row length')
+
+        return cls(elements_array, rows_count=len(elements_array) // columns_count, columns_count=columns_count)
+
+    @classmethod
+    def open(cls, path: str, *, rows_count: int, columns_count: int) -> Self:
+        elements_count = rows_count * columns_count
+
+        if not elements_count:
+            return cls(array.array('q'), rows_count=rows_count, columns_count=columns_count)
+
+        with open(path, 'rb') as matrix_file:
+            file_size = matrix_file.seek(0, 2)
+
+            if file_size < elements_count * INT64_SIZE:
+                raise ValueError('Matrix file is too short')
+
+            if file_size % INT64_SIZE:
+                raise ValueError('Invalid matrix file size')
+
+            matrix_mmap = mmap.mmap(matrix_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        elements = memoryview(matrix_mmap).cast('q')
+
+        matrix = cls(elements, rows_count=rows_count, columns_count=columns_count)
+        matrix._mmap = matrix_mmap
+
+        return matrix
+
+    @classmethod
+    def read(cls, rows_count: int, columns_count: int) -> Self:
+        elements = array.array('q', (
+            int(token)
+            for _row_num in range(rows_count)
+            for token in sys.stdin.readline().split()[:columns_count]
+        ))
+
+        return cls(elements, rows_count=rows_count, columns_count=columns_count)
+
+
+def read_int() -> int:
+    return int(input().strip())
+
+
+def main() -> None:
+    rows_count = read_int()
+    columns_count = read_int()
+    matrix = DenseMatrix.read(rows_count, columns_count)
+    row = read_int()
+    column = read_int()
+
+    neighbours = matrix.get_neighbours(row, column)
+    print(*neighbours)
+
+
+if __name__ == '__main__':
+    main()
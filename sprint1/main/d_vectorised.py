@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import array
+import itertools
+import mmap
+import operator
+import sys
+from collections.abc import Iterable, Sequence
+from typing import Self
+
+CHUNK_SIZE = 1 << 16
+INT64_SIZE = 8
+
+
+def get_weather_randomness(temperatures: Sequence[int], *, chunk_size: int = CHUNK_SIZE) -> int:
+    if isinstance(temperatures, array.array):
+        temperatures = memoryview(temperatures)
+
+    temperatures_count = len(temperatures)
+
+    if temperatures_count < 2:
+        return temperatures_count
+
+    result = (
+            (temperatures[0] > temperatures[1]) +
+            (temperatures[-1] > temperatures[-2])
+    )
+
+    # Внутренние дни обрабатываются блоками: каждый блок сравнивается со сдвинутыми на один день
+    # влево и вправо срезами, которые захватывают по одному соседнему значению за границами блока.
+    for start in range(1, temperatures_count - 1, chunk_size):
+        stop = min(start + chunk_size, temperatures_count - 1)
+        current = temperatures[start:stop]
+
+        result += sum(map(
+            operator.and_,
+            map(operator.gt, current, temperatures[start - 1:stop - 1]),
+            map(operator.gt, current, temperatures[start + 1:stop + 1]),
+        ))
+
+    return result
+
+
+def get_weather_randomness_many(temperatures: Sequence[int],
+                                series_lengths: Iterable[int],
+                                *,
+                                chunk_size: int = CHUNK_SIZE) -> Sequence[int]:
+    if isinstance(temperatures, array.array):
+        temperatures = memoryview(temperatures)
+
+    result: list[int] = []
+    offset = 0
+
+    for series_length in series_lengths:
+        series = temperatures[offset:offset + series_length]
+        result.append(get_weather_randomness(series, chunk_size=chunk_size))
+        offset += series_length
+
+    return result
+
+
+class TemperatureSeriesFile:
+    # Формат файла: количество рядов, затем длины всех рядов и после них значения всех рядов подряд.
+    # Все числа записываются как int64.
+    series_lengths: Sequence[int]
+    temperatures: Sequence[int]
+
+    _mmap: mmap.mmap | None
+    _values: memoryview | None
+
+    def __init__(self, *, series_lengths: Sequence[int], temperatures: Sequence[int]) -> None:
+        self.series_lengths = series_lengths
+        self.temperatures = temperatures
+
+        self._mmap = None
+        self._values = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mmap is None:
+            return
+
+        for view in (self.series_lengths, self.temperatures, self._values):
+            if isinstance(view, memoryview):
+                view.release()
+
+        self.series_lengths = self.temperatures = array.array('q')
+        self._values = None
+        self._mmap.close()
+        self._mmap = None
+
+    def get_weather_randomness_many(self, *, chunk_size: int = CHUNK_SIZE) -> Sequence[int]:
+        return get_weather_randomness_many(self.temperatures, self.series_lengths, chunk_size=chunk_size)
+
+    @classmethod
+    def open(cls, path: str) -> Self:
+        with open(path, 'rb') as series_file:
+            file_size = series_file.seek(0, 2)
+
+            if not file_size:
+                raise ValueError('Series file is too short')
+
+            if file_size % INT64_SIZE:
+                raise ValueError('Invalid series file size')
+
+            series_mmap = mmap.mmap(series_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        values = memoryview(series_mmap).cast('q')
+        series_count = values[0]
+
+        if not 0 <= series_count < len(values):
+            values.release()
+            series_mmap.close()
+            raise ValueError('Series file is too short')
+
+        series_lengths = values[1:series_count + 1]
+        temperatures = values[series_count + 1:]
+
+        if min(series_lengths, default=0) < 0 or sum(series_lengths) > len(temperatures):
+            for view in (series_lengths, temperatures, values):
+                view.release()
+
+            series_mmap.close()
+            raise ValueError('Series lengths exceed the stored temperatures')
+
+        series_file_data = cls(series_lengths=series_lengths, temperatures=temperatures)
+        series_file_data._mmap = series_mmap
+        series_file_data._values = values
+
+        return series_file_data
+
+    @staticmethod
+    def write(path: str, series_list: Iterable[Sequence[int]]) -> None:
+        series_list = list(series_list)
+
+        with open(path, 'wb') as series_file:
+            array.array('q', [len(series_list)]).tofile(series_file)
+            array.array('q', map(len, series_list)).tofile(series_file)
+
+            for series in series_list:
+                array.array('q', series).tofile(series_file)
+
+
+def main() -> None:
+    temperatures_count = int(input().strip())
+    temperatures = array.array('q', itertools.islice(
+        map(int, sys.stdin.readline().strip().split()),
+        temperatures_count,
+    ))
+    print(get_weather_randomness(temperatures))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import io
+import re
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from typing import BinaryIO
+
+BLOCK_SIZE = 1 << 22
+
+WORD_PATTERN = re.compile(r'\w+')
+
+ASCII_WORD_BYTES = b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_abcdefghijklmnopqrstuvwxyz'
+SEPARATOR = b' '
+
+# Все ASCII-символы, не входящие в `\w`, заменяются пробелами, а остальные байты, включая байты
+# многобайтовых символов UTF-8, остаются без изменений.
+WORD_SEPARATORS_TABLE = bytes(
+    byte if byte in ASCII_WORD_BYTES or byte >= 0x80 else SEPARATOR[0]
+    for byte in range(256)
+)
+
+
+def iter_word_blocks(blocks: Iterable[bytes]) -> Iterator[Sequence[str]]:
+    tail = b''
+    normalized_tail = b''
+
+    for data in blocks:
+        block = tail + data
+        normalized_block = normalized_tail + data.translate(WORD_SEPARATORS_TABLE)
+
+        # Блок обрезается по последнему ASCII-разделителю: такой байт не может находиться ни внутри
+        # слова, ни внутри многобайтового символа.
+        cut_pos = normalized_block.rfind(SEPARATOR) + 1
+        tail = block[cut_pos:]
+        normalized_tail = normalized_block[cut_pos:]
+
+        if cut_pos:
+            yield _split_words(block[:cut_pos], normalized_block[:cut_pos])
+
+    if tail:
+        yield _split_words(tail, normalized_tail)
+
+
+def read_blocks(stream: BinaryIO, *, block_size: int = BLOCK_SIZE, limit: int | None = None) -> Iterator[bytes]:
+    while limit is None or limit > 0:
+        data = stream.read(block_size if limit is None else min(block_size, limit))
+
+        if not data:
+            break
+
+        if limit is not None:
+            limit -= len(data)
+
+        yield data
+
+
+def get_longest_word_from_blocks(blocks: Iterable[bytes]) -> str:
+    result = ''
+
+    for words in iter_word_blocks(blocks):
+        longest_word = max(words, key=len, default='')
+
+        if len(longest_word) > len(result):
+            result = longest_word
+
+    return result
+
+
+def get_longest_word_from_stream(stream: BinaryIO, *, block_size: int = BLOCK_SIZE) -> str:
+    return get_longest_word_from_blocks(read_blocks(stream, block_size=block_size))
+
+
+def get_longest_word(line: str) -> str:
+    return get_longest_word_from_stream(io.BytesIO(line.encode()))
+
+
+def _split_words(block: bytes, normalized_block: bytes) -> Sequence[str]:
+    if block.isascii():
+        return normalized_block.decode().split()
+
+    return WORD_PATTERN.findall(block.decode())
+
+
+def main() -> None:
+    line_len = int(sys.stdin.buffer.readline().strip())
+    line = sys.stdin.buffer.readline().decode().strip()[:line_len]
+
+    longest_word = get_longest_word(line)
+    print(longest_word)
+    print(len(longest_word))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import mmap
+import sys
+from collections.abc import Sequence
+
+BLOCK_SIZE = 1 << 22
+
+ASCII_ALNUM_BYTES = b'0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+ASCII_LOWER_TABLE = bytes.maketrans(
+    b'ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    b'abcdefghijklmnopqrstuvwxyz',
+)
+ASCII_NON_ALNUM_BYTES = bytes(byte for byte in range(256) if byte not in ASCII_ALNUM_BYTES)
+
+
+class AlnumLowerTable(dict[int, str | None]):
+    def __missing__(self, code: int) -> str | None:
+        char = chr(code)
+
+        if not char.isalnum():
+            value = None
+        else:
+            value = char.lower()
+
+            # Строчная форма некоторых символов состоит из нескольких символов. Такой символ
+            # заменяется самим собой, чтобы при сравнении он оставался одной позицией строки.
+            if len(value) != 1:
+                value = char
+
+        self[code] = value
+
+        return value
+
+
+ALNUM_LOWER_TABLE = AlnumLowerTable()
+
+
+def normalize_alnum(block: bytes) -> str:
+    if block.isascii():
+        return block.translate(ASCII_LOWER_TABLE, ASCII_NON_ALNUM_BYTES).decode()
+
+    return block.decode().translate(ALNUM_LOWER_TABLE)
+
+
+def is_palindrome_buffer(buffer: Sequence[int], *, block_size: int = BLOCK_SIZE) -> bool:
+    start = 0
+    end = len(buffer)
+    start_chars = ''
+    end_chars = ''
+
+    while start < end:
+        if not start_chars:
+            block_end = _get_char_boundary(buffer, min(start + block_size, end), end, 1)
+            start_chars = normalize_alnum(buffer[start:block_end])
+            start = block_end
+
+        if not end_chars and start < end:
+            block_start = _get_char_boundary(buffer, max(end - block_size, start), start, -1)
+            end_chars = normalize_alnum(buffer[block_start:end])[::-1]
+            end = block_start
+
+        compared_count = min(len(start_chars), len(end_chars))
+
+        if start_chars[:compared_count] != end_chars[:compared_count]:
+            return False
+
+        start_chars = start_chars[compared_count:]
+        end_chars = end_chars[compared_count:]
+
+    # Обе границы сошлись, поэтому оставшиеся символы образуют середину строки.
+    middle_chars = start_chars + end_chars[::-1]
+
+    return middle_chars == middle_chars[::-1]
+
+
+def is_palindrome_file(path: str, *, block_size: int = BLOCK_SIZE) -> bool:
+    with open(path, 'rb') as text_file:
+        if not text_file.seek(0, 2):
+            return True
+
+        with mmap.mmap(text_file.fileno(), 0, access=mmap.ACCESS_READ) as text_mmap:
+            return is_palindrome_buffer(text_mmap, block_size=block_size)
+
+
+def is_palindrome(line: str) -> bool:
+    return is_palindrome_buffer(line.encode())
+
+
+def _get_char_boundary(buffer: Sequence[int], pos: int, limit: int, step: int) -> int:
+    # Граница блока сдвигается в сторону `limit`, пока она указывает на байт продолжения
+    # многобайтового символа UTF-8.
+    while pos != limit and buffer[pos] & 0xc0 == 0x80:
+        pos += step
+
+    return pos
+
+
+def main() -> None:
+    line = sys.stdin.buffer.readline().strip()
+    print(is_palindrome_buffer(line))
+
+
+if __name__ == '__main__':
+    main()
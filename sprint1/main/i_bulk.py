@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import array
+import functools
+import sys
+from collections.abc import Iterable, Sequence
+
+INT64_MAX = (1 << 63) - 1
+
+
+def is_power_of_4(value: int) -> bool:
+    # Степень четверки — это степень двойки, единственный установленный бит которой стоит на четной
+    # позиции.
+    return value > 0 and value & (value - 1) == 0 and value.bit_length() & 1 == 1
+
+
+@functools.cache
+def get_powers(base: int) -> frozenset[int]:
+    if base < 2:
+        raise ValueError('Base must be at least 2')
+
+    powers: set[int] = set()
+    power = 1
+
+    while power <= INT64_MAX:
+        powers.add(power)
+        power *= base
+
+    return frozenset(powers)
+
+
+def is_power_of(value: int, base: int) -> bool:
+    if base < 2:
+        raise ValueError('Base must be at least 2')
+
+    if value <= INT64_MAX:
+        return value in get_powers(base)
+
+    while value % base == 0:
+        value //= base
+
+    return value == 1
+
+
+def get_powers_of_4_mask(values: Iterable[int]) -> bytearray:
+    return get_powers_mask(values, 4)
+
+
+def get_powers_mask(values: Iterable[int], base: int) -> bytearray:
+    return bytearray(map(get_powers(base).__contains__, values))
+
+
+def read_values(values_count: int) -> Sequence[int]:
+    return array.array('q', map(int, sys.stdin.buffer.read().split()[:values_count]))
+
+
+def main() -> None:
+    values_count = int(sys.stdin.buffer.readline().strip())
+    mask = get_powers_of_4_mask(read_values(values_count))
+
+    sys.stdout.write(''.join(
+        'True\n' if is_power else 'False\n'
+        for is_power in mask
+    ))
+
+
+if __name__ == '__main__':
+    main()
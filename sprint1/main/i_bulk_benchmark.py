@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import array
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+import i
+import i_bulk
+
+
+def measure(name: str, values_count: int, function: Callable[[], Sequence[int]]) -> Sequence[int]:
+    start_time = time.perf_counter()
+    result = function()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f'{name:<32} {elapsed_time:8.3f} s {values_count / elapsed_time / 1e6:8.2f} M values/s')
+
+    return result
+
+
+def main() -> None:
+    values_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    values = array.array('q', (
+        4 ** random.randrange(32) if random.random() < 0.5 else random.randint(-10 ** 18, 10 ** 18)
+        for _ in range(values_count)
+    ))
+
+    result_loop = measure('i.is_power_of_4()', values_count, lambda: bytearray(map(
+        i.is_power_of_4,
+        values,
+    )))
+    result_scalar = measure('i_bulk.is_power_of_4()', values_count, lambda: bytearray(map(
+        i_bulk.is_power_of_4,
+        values,
+    )))
+    result_mask = measure('i_bulk.get_powers_of_4_mask()', values_count, lambda: i_bulk.get_powers_of_4_mask(
+        values,
+    ))
+
+    assert result_loop == result_scalar == result_mask
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import array
+import functools
+import math
+import multiprocessing
+import random
+import sys
+from collections.abc import Callable, Iterable, Sequence
+
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+class FactorizationEngine:
+    sieve_limit: int
+    smallest_prime_factors: array.array[int]
+    factorize_cached: Callable[[int], tuple[int, ...]]
+
+    def __init__(self, *, sieve_limit: int = 10 ** 6, cache_size: int | None = 1 << 16) -> None:
+        self.sieve_limit = max(sieve_limit, 2)
+        self.smallest_prime_factors = get_smallest_prime_factors(self.sieve_limit)
+        self.factorize_cached = functools.lru_cache(maxsize=cache_size)(self._factorize)
+
+    def factorize(self, value: int) -> Sequence[int]:
+        if value < 2:
+            return []
+
+        return list(self.factorize_cached(value))
+
+    def factorize_many(self,
+                       values: Iterable[int],
+                       *,
+                       processes: int | None = None,
+                       chunksize: int = 1024) -> Sequence[Sequence[int]]:
+        values_list = list(values)
+
+        if processes == 1 or len(values_list) <= chunksize:
+            return [self.factorize(value) for value in values_list]
+
+        with multiprocessing.Pool(
+                processes,
+                initializer=_init_worker,
+                initargs=(self.sieve_limit,),
+        ) as pool:
+            return pool.map(_factorize_in_worker, values_list, chunksize=chunksize)
+
+    def _factorize(self, value: int) -> tuple[int, ...]:
+        result: list[int] = []
+        pending = [value]
+
+        while pending:
+            value = pending.pop()
+
+            if value <= self.sieve_limit:
+                while value > 1:
+                    prime = self.smallest_prime_factors[value]
+                    result.append(prime)
+                    value //= prime
+
+                continue
+
+            if is_prime(value):
+                result.append(value)
+                continue
+
+            divisor = find_divisor(value)
+            pending.append(divisor)
+            pending.append(value // divisor)
+
+        result.sort()
+
+        return tuple(result)
+
+
+def get_smallest_prime_factors(limit: int) -> array.array[int]:
+    is_prime_flags = bytearray([1]) * (limit + 1)
+    is_prime_flags[0] = is_prime_flags[1] = 0
+    limit_sqrt = math.isqrt(limit)
+
+    for i in range(2, limit_sqrt + 1):
+        if is_prime_flags[i]:
+            is_prime_flags[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+
+    smallest_prime_factors = array.array('q', range(limit + 1))
+
+    # Кратные меньших простых чисел записываются последними, поэтому в каждой ячейке остается
+    # наименьший простой делитель.
+    for i in range(limit_sqrt, 1, -1):
+        if is_prime_flags[i]:
+            smallest_prime_factors[i * i::i] = array.array('q', [i]) * len(range(i * i, limit + 1, i))
+
+    return smallest_prime_factors
+
+
+def is_prime(value: int) -> bool:
+    if value < 2:
+        return False
+
+    for prime in MILLER_RABIN_BASES:
+        if value % prime == 0:
+            return value == prime
+
+    d = value - 1
+    s = 0
+
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for base in MILLER_RABIN_BASES:
+        x = pow(base, d, value)
+
+        if x == 1 or x == value - 1:
+            continue
+
+        for _i in range(s - 1):
+            x = x * x % value
+
+            if x == value - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def find_divisor(value: int) -> int:
+    if value % 2 == 0:
+        return 2
+
+    for prime in MILLER_RABIN_BASES:
+        if value % prime == 0:
+            return prime
+
+    while True:
+        y = random.randrange(1, value)
+        c = random.randrange(1, value)
+        batch_size = 128
+        g = r = q = 1
+        x = ys = y
+
+        while g == 1:
+            x = y
+
+            for _i in range(r):
+                y = (y * y + c) % value
+
+            k = 0
+
+            while k < r and g == 1:
+                ys = y
+
+                for _i in range(min(batch_size, r - k)):
+                    y = (y * y + c) % value
+                    q = q * abs(x - y) % value
+
+                g = math.gcd(q, value)
+                k += batch_size
+
+            r *= 2
+
+        if g == value:
+            g = 1
+
+            while g == 1:
+                ys = (ys * ys + c) % value
+                g = math.gcd(abs(x - ys), value)
+
+        if g != value:
+            return g
+
+
+_worker_engine: FactorizationEngine | None = None
+
+
+def _init_worker(sieve_limit: int) -> None:
+    global _worker_engine
+    _worker_engine = FactorizationEngine(sieve_limit=sieve_limit)
+
+
+def _factorize_in_worker(value: int) -> Sequence[int]:
+    assert _worker_engine is not None
+    return _worker_engine.factorize(value)
+
+
+def main() -> None:
+    values = list(map(int, sys.stdin.buffer.read().split()))
+    engine = FactorizationEngine(sieve_limit=min(max(values, default=2), 10 ** 6))
+
+    sys.stdout.write(''.join(
+        ' '.join(map(str, factors)) + '\n'
+        for factors in engine.factorize_many(values)
+    ))
+
+
+if __name__ == '__main__':
+    main()
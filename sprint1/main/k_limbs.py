@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import array
+import itertools
+import sys
+from collections.abc import Sequence
+
+DECIMAL_LIMB_DIGITS = 18
+DECIMAL_LIMB_BASE = 10 ** DECIMAL_LIMB_DIGITS
+
+BINARY_LIMB_DIGITS = 64
+BINARY_LIMB_BASE = 1 << BINARY_LIMB_DIGITS
+
+DIGIT_CHARS = b'0123456789'
+DIGIT_VALUES = bytes.maketrans(DIGIT_CHARS, bytes(range(10)))
+DIGIT_CHARS_TABLE = bytes.maketrans(bytes(range(10)), DIGIT_CHARS)
+
+type Limbs = array.array[int]
+
+
+def add_limbs(a: Limbs, b: Limbs, *, base: int) -> Limbs:
+    if len(b) > len(a):
+        a, b = b, a
+
+    result = array.array('Q', a)
+    result.append(0)
+    carry = 0
+
+    for i, b_limb in enumerate(b):
+        limb_sum = result[i] + b_limb + carry
+
+        if limb_sum >= base:
+            result[i] = limb_sum - base
+            carry = 1
+        else:
+            result[i] = limb_sum
+            carry = 0
+
+    i = len(b)
+
+    while carry:
+        limb_sum = result[i] + carry
+
+        if limb_sum >= base:
+            result[i] = limb_sum - base
+        else:
+            result[i] = limb_sum
+            carry = 0
+
+        i += 1
+
+    while len(result) > 1 and result[-1] == 0:
+        result.pop()
+
+    return result
+
+
+def digits_str_to_limbs(digits_str: str | bytes, *, limb_digits: int, radix: int) -> Limbs:
+    limbs = array.array('Q')
+
+    for limb_end in range(len(digits_str), 0, -limb_digits):
+        limbs.append(int(digits_str[max(limb_end - limb_digits, 0):limb_end], radix))
+
+    if not limbs:
+        limbs.append(0)
+
+    return limbs
+
+
+def limbs_to_digits_str(limbs: Limbs, *, limb_digits: int, radix_format: str) -> str:
+    limb_format = f'0{limb_digits}{radix_format}'
+
+    return format(limbs[-1], radix_format) + ''.join(
+        format(limbs[i], limb_format)
+        for i in range(len(limbs) - 2, -1, -1)
+    )
+
+
+def digits_to_limbs(digits: Sequence[int]) -> Limbs:
+    digits_bytes = bytes(digits).translate(DIGIT_CHARS_TABLE)
+    return digits_str_to_limbs(digits_bytes, limb_digits=DECIMAL_LIMB_DIGITS, radix=10)
+
+
+def limbs_to_digits(limbs: Limbs, *, min_length: int = 0) -> Sequence[int]:
+    digits_str = limbs_to_digits_str(limbs, limb_digits=DECIMAL_LIMB_DIGITS, radix_format='d')
+    return list(digits_str.zfill(min_length).encode().translate(DIGIT_VALUES))
+
+
+def int_to_limbs(value: int, *, base: int) -> Limbs:
+    limbs = array.array('Q')
+
+    while True:
+        value, limb = divmod(value, base)
+        limbs.append(limb)
+
+        if not value:
+            return limbs
+
+
+def get_sum(x: Sequence[int], k: int) -> Sequence[int]:
+    if not x and not k:
+        return []
+
+    x_limbs = digits_to_limbs(x)
+    k_limbs = int_to_limbs(k, base=DECIMAL_LIMB_BASE)
+
+    sum_limbs = add_limbs(x_limbs, k_limbs, base=DECIMAL_LIMB_BASE)
+    return limbs_to_digits(sum_limbs, min_length=len(x))
+
+
+def binary_sum(a: str, b: str) -> str:
+    a_limbs = digits_str_to_limbs(a, limb_digits=BINARY_LIMB_DIGITS, radix=2)
+    b_limbs = digits_str_to_limbs(b, limb_digits=BINARY_LIMB_DIGITS, radix=2)
+
+    sum_limbs = add_limbs(a_limbs, b_limbs, base=BINARY_LIMB_BASE)
+    sum_str = limbs_to_digits_str(sum_limbs, limb_digits=BINARY_LIMB_DIGITS, radix_format='b')
+
+    return sum_str.zfill(max(len(a), len(b)))
+
+
+def read_int() -> int:
+    return int(input().strip())
+
+
+def read_int_array(length: int) -> Sequence[int]:
+    return list(itertools.islice(
+        map(int, sys.stdin.readline().split()),
+        length,
+    ))
+
+
+def main() -> None:
+    x_len = read_int()
+    x = read_int_array(x_len)
+    k = read_int()
+
+    print(*get_sum(x, k))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import random
+import sys
+import time
+from collections.abc import Callable
+
+import h
+import k
+import k_limbs
+
+
+def measure(name: str, function: Callable[[], object]) -> float:
+    start_time = time.perf_counter()
+    function()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f'{name:<28} {elapsed_time:8.3f} s')
+
+    return elapsed_time
+
+
+def main() -> None:
+    digits_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+
+    x = [random.randint(1, 9)] + [random.randint(0, 9) for _ in range(digits_count - 1)]
+    k_value = random.randint(0, 10 ** 9)
+    a = '1' + ''.join(random.choice('01') for _ in range(digits_count - 1))
+    b = '1' + ''.join(random.choice('01') for _ in range(digits_count - 1))
+
+    print(f'digits: {digits_count}')
+
+    digits_time = measure('k.get_sum()', lambda: k.get_sum(x, k_value))
+    limbs_time = measure('k_limbs.get_sum()', lambda: k_limbs.get_sum(x, k_value))
+    print(f'speedup: {digits_time / limbs_time:.1f}x')
+
+    digits_time = measure('h.binary_sum()', lambda: h.binary_sum(a, b))
+    limbs_time = measure('k_limbs.binary_sum()', lambda: k_limbs.binary_sum(a, b))
+    print(f'speedup: {digits_time / limbs_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import collections
+import dataclasses
+import itertools
+import multiprocessing
+import multiprocessing.pool
+import os
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TextIO
+
+CHUNK_SIZE = 1 << 12
+PENDING_CHUNKS_PER_PROCESS = 2
+
+type LettersPair = tuple[str, str]
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class LettersDifference:
+    extra: str
+    missing: str
+
+
+def get_letters_difference(a: str, b: str) -> LettersDifference:
+    a_counter = collections.Counter(a)
+    b_counter = collections.Counter(b)
+
+    return LettersDifference(
+        extra=''.join(sorted((b_counter - a_counter).elements())),
+        missing=''.join(sorted((a_counter - b_counter).elements())),
+    )
+
+
+def get_extra_letter(a: str, b: str) -> str:
+    if len(b) != len(a) + 1:
+        return ''
+
+    extra_letters = get_letters_difference(a, b).extra
+
+    if len(extra_letters) == 1:
+        return extra_letters
+
+    # Если строка `b` не получена из `a` добавлением одного символа, то результат совпадает с исходной
+    # реализацией через разность сумм кодов символов.
+    return chr(sum(map(ord, b)) - sum(map(ord, a)))
+
+
+def get_letters_differences(pairs: Iterable[LettersPair],
+                            *,
+                            processes: int | None = None,
+                            chunk_size: int = CHUNK_SIZE) -> Iterator[LettersDifference]:
+    chunks = itertools.batched(pairs, chunk_size)
+    first_chunk = next(chunks, ())
+
+    if processes == 1 or len(first_chunk) < chunk_size:
+        for chunk in itertools.chain([first_chunk], chunks):
+            yield from _get_chunk_differences(chunk)
+
+        return
+
+    processes_count = processes or os.cpu_count() or 1
+    max_pending_count = processes_count * PENDING_CHUNKS_PER_PROCESS
+
+    # В отличие от `Pool.imap()`, который вычитывает входные данные без ограничений, в обработке
+    # одновременно находится не более `max_pending_count` блоков, поэтому память остается ограниченной.
+    with multiprocessing.Pool(processes_count) as pool:
+        pending: collections.deque[multiprocessing.pool.AsyncResult[Sequence[LettersDifference]]] = (
+            collections.deque()
+        )
+
+        for chunk in itertools.chain([first_chunk], chunks):
+            if len(pending) >= max_pending_count:
+                yield from pending.popleft().get()
+
+            pending.append(pool.apply_async(_get_chunk_differences, (chunk,)))
+
+        while pending:
+            yield from pending.popleft().get()
+
+
+def read_pairs(stream: TextIO) -> Iterator[LettersPair]:
+    lines = map(str.strip, stream)
+
+    for a in lines:
+        b = next(lines, '')
+        yield a, b
+
+
+def _get_chunk_differences(chunk: Sequence[LettersPair]) -> Sequence[LettersDifference]:
+    return [get_letters_difference(a, b) for a, b in chunk]
+
+
+def main() -> None:
+    differences = get_letters_differences(read_pairs(sys.stdin))
+    sys.stdout.writelines(difference.extra + '\n' for difference in differences)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+# -- Принцип работы --
+#
+# Пакетный вариант исполнителя команд из `a_simplified.py`. Дек реализован точно так же, а отличается
+# только способ разбора команд. Весь стандартный ввод считывается в виде одного буфера байтов и за
+# один вызов `bytes.split()` разбивается на токены. Далее для каждой команды ее имя ищется в таблице
+# диспетчеризации, которая сразу возвращает связанный метод дека, без сопоставления с регулярными
+# выражениями и без создания объектов команд. Результаты команд накапливаются в списке и выводятся
+# одной операцией записи.
+#
+# -- Временная сложность --
+#
+# Обработка каждой команды выполняется за фиксированное число операций, поэтому временная сложность
+# составляет `O(n)`, где `n` — количество команд.
+#
+# -- Пространственная сложность --
+#
+# Помимо буфера дека размером `O(max_size)`, в памяти хранятся все токены входных данных и результаты
+# команд, поэтому пространственная сложность составляет `O(n + max_size)`.
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable, Mapping, Sequence
+
+
+class Deque:
+    max_size: int
+
+    items: list[int]
+    head_pos: int
+    tail_pos: int
+    size: int
+
+    def __init__(self, *, max_size: int) -> None:
+        self.max_size = max_size
+
+        self.items = [0] * self.max_size
+        self.head_pos = self.tail_pos = self.size = 0
+
+    def push_back(self, item: int) -> None:
+        if self.size == self.max_size:
+            raise ValueError('Deque max size exceeded')
+
+        self.items[self.tail_pos] = item
+        self.tail_pos = (self.tail_pos + 1) % self.max_size
+        self.size += 1
+
+    def push_front(self, item: int) -> None:
+        if self.size == self.max_size:
+            raise ValueError('Deque max size exceeded')
+
+        self.head_pos = (self.head_pos - 1) % self.max_size
+        self.items[self.head_pos] = item
+        self.size += 1
+
+    def pop_back(self) -> int:
+        if self.size == 0:
+            raise ValueError('Deque is empty')
+
+        self.tail_pos = (self.tail_pos - 1) % self.max_size
+        item = self.items[self.tail_pos]
+        self.size -= 1
+
+        return item
+
+    def pop_front(self) -> int:
+        if self.size == 0:
+            raise ValueError('Deque is empty')
+
+        item = self.items[self.head_pos]
+        self.head_pos = (self.head_pos + 1) % self.max_size
+        self.size -= 1
+
+        return item
+
+
+type DequeArgumentCommand = Callable[[int], None]
+type DequeResultCommand = Callable[[], int]
+
+
+class DequeBatchCommandsExecutor:
+    deque: Deque
+    argument_commands: Mapping[bytes, DequeArgumentCommand]
+    result_commands: Mapping[bytes, DequeResultCommand]
+
+    def __init__(self, deque: Deque) -> None:
+        self.deque = deque
+        self.argument_commands = {
+            b'push_back': self.deque.push_back,
+            b'push_front': self.deque.push_front,
+        }
+        self.result_commands = {
+            b'pop_back': self.deque.pop_back,
+            b'pop_front': self.deque.pop_front,
+        }
+
+    def execute_all(self, tokens: Sequence[bytes], *, commands_count: int, start: int = 0) -> list[str]:
+        argument_commands = self.argument_commands
+        result_commands = self.result_commands
+        results: list[str] = []
+        pos = start
+
+        for i in range(commands_count):
+            command_name = tokens[pos]
+            pos += 1
+
+            argument_command = argument_commands.get(command_name)
+
+            if argument_command is not None:
+                try:
+                    argument_command(int(tokens[pos]))
+                except ValueError:
+                    results.append('error')
+
+                pos += 1
+                continue
+
+            result_command = result_commands.get(command_name)
+
+            if result_command is not None:
+                try:
+                    results.append(str(result_command()))
+                except ValueError:
+                    results.append('error')
+
+        return results
+
+
+def main() -> None:
+    tokens = sys.stdin.buffer.read().split()
+    commands_count = int(tokens[0])
+    max_size = int(tokens[1])
+
+    deque = Deque(max_size=max_size)
+    commands_executor = DequeBatchCommandsExecutor(deque)
+    results = commands_executor.execute_all(tokens, commands_count=commands_count, start=2)
+
+    if results:
+        sys.stdout.write('\n'.join(results) + '\n')
+
+
+if __name__ == '__main__':
+    main()
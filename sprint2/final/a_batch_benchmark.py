@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+import a
+import a_batch
+import a_simplified
+
+
+def generate_commands(commands_count: int) -> Sequence[str]:
+    commands: list[str] = []
+
+    for i in range(commands_count):
+        command_name = random.choice(['push_back', 'push_front', 'pop_back', 'pop_front'])
+
+        if command_name.startswith('push'):
+            commands.append(f'{command_name} {random.randint(-1000, 1000)}')
+        else:
+            commands.append(command_name)
+
+    return commands
+
+
+def measure(name: str, commands_count: int, function: Callable[[], Sequence[str]]) -> Sequence[str]:
+    start_time = time.perf_counter()
+    results = function()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f'{name:<28} {elapsed_time:8.3f} s {commands_count / elapsed_time / 1e6:8.2f} M commands/s')
+
+    return results
+
+
+def run_regex_executor(commands: Sequence[str], *, max_size: int) -> Sequence[str]:
+    commands_executor = a_simplified.DequeCommandsExecutor(a_simplified.Deque(max_size=max_size))
+    return [result for command_str in commands if (result := commands_executor.execute(command_str)) is not None]
+
+
+def run_command_objects_executor(commands: Sequence[str], *, max_size: int) -> Sequence[str]:
+    commands_executor = a.DequeCommandsExecutor(a.Deque(max_size=max_size))
+    return [result for command_str in commands if (result := commands_executor.execute(command_str)) is not None]
+
+
+def run_batch_executor(commands_data: bytes, *, commands_count: int, max_size: int) -> Sequence[str]:
+    commands_executor = a_batch.DequeBatchCommandsExecutor(a_batch.Deque(max_size=max_size))
+    return commands_executor.execute_all(commands_data.split(), commands_count=commands_count)
+
+
+def main() -> None:
+    commands_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    max_size = 1000
+
+    commands = generate_commands(commands_count)
+    commands_data = '\n'.join(commands).encode()
+
+    results_a = measure('a.py (command objects)', commands_count, lambda: run_command_objects_executor(
+        commands,
+        max_size=max_size,
+    ))
+    results_a_simplified = measure('a_simplified.py (regex)', commands_count, lambda: run_regex_executor(
+        commands,
+        max_size=max_size,
+    ))
+    results_a_batch = measure('a_batch.py (dispatch table)', commands_count, lambda: run_batch_executor(
+        commands_data,
+        commands_count=commands_count,
+        max_size=max_size,
+    ))
+
+    assert results_a == results_a_simplified == results_a_batch
+
+
+if __name__ == '__main__':
+    main()
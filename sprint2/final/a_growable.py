@@ -0,0 +1,190 @@
+# -- Принцип работы --
+#
+# Неограниченный вариант дека из `a_simplified.py`. Элементы по-прежнему хранятся в кольцевом буфере,
+# но вместо списка Python используется компактный массив `array('q')`, а емкость буфера всегда является
+# степенью двойки. Благодаря этому вместо взятия остатка от деления указатели на начало и конец очереди
+# вычисляются побитовым `&` с маской `capacity - 1`.
+#
+# Если при добавлении элементов буфер оказывается заполнен, то выделяется новый буфер вдвое большего
+# размера, в начало которого копируются два непрерывных отрезка старого буфера: от начала очереди до
+# конца буфера и от начала буфера до конца очереди. Таким образом порядок элементов сохраняется.
+#
+# Пакетные операции `extend_back()`, `extend_front()`, `pop_many_back()` и `pop_many_front()` также
+# копируют элементы не по одному, а не более чем двумя срезами массива.
+#
+# -- Временная сложность --
+#
+# Добавление и удаление одного элемента, а также доступ по индексу выполняются за амортизированное
+# время `O(1)`. Пакетные операции над `k` элементами выполняются за амортизированное время `O(k)`.
+#
+# -- Пространственная сложность --
+#
+# Емкость буфера не превышает удвоенного наибольшего числа элементов, одновременно находившихся в деке,
+# поэтому пространственная сложность составляет `O(n)`.
+
+from __future__ import annotations
+
+import array
+from collections.abc import Iterable, Iterator
+
+
+class GrowableDeque:
+    items: array.array[int]
+    mask: int
+    head_pos: int
+    size: int
+
+    def __init__(self, items: Iterable[int] = (), *, initial_capacity: int = 8) -> None:
+        capacity = 1
+
+        while capacity < initial_capacity:
+            capacity *= 2
+
+        self.items = array.array('q', bytes(capacity * 8))
+        self.mask = capacity - 1
+        self.head_pos = self.size = 0
+
+        self.extend_back(items)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        return self.size != 0
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._copy_range(0, self.size))
+
+    def __getitem__(self, index: int | slice) -> int | array.array[int]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.size)
+
+            if step == 1:
+                return self._copy_range(start, max(start, stop))
+
+            return self._copy_range(0, self.size)[index]
+
+        if index < 0:
+            index += self.size
+
+        if not 0 <= index < self.size:
+            raise IndexError('Deque index out of range')
+
+        return self.items[(self.head_pos + index) & self.mask]
+
+    def __setitem__(self, index: int, item: int) -> None:
+        if index < 0:
+            index += self.size
+
+        if not 0 <= index < self.size:
+            raise IndexError('Deque index out of range')
+
+        self.items[(self.head_pos + index) & self.mask] = item
+
+    def push_back(self, item: int) -> None:
+        if self.size > self.mask:
+            self._grow(self.size + 1)
+
+        self.items[(self.head_pos + self.size) & self.mask] = item
+        self.size += 1
+
+    def push_front(self, item: int) -> None:
+        if self.size > self.mask:
+            self._grow(self.size + 1)
+
+        self.head_pos = (self.head_pos - 1) & self.mask
+        self.items[self.head_pos] = item
+        self.size += 1
+
+    def pop_back(self) -> int:
+        if self.size == 0:
+            raise ValueError('Deque is empty')
+
+        self.size -= 1
+        return self.items[(self.head_pos + self.size) & self.mask]
+
+    def pop_front(self) -> int:
+        if self.size == 0:
+            raise ValueError('Deque is empty')
+
+        item = self.items[self.head_pos]
+        self.head_pos = (self.head_pos + 1) & self.mask
+        self.size -= 1
+
+        return item
+
+    def extend_back(self, items: Iterable[int]) -> None:
+        new_items = array.array('q', items)
+        new_items_count = len(new_items)
+
+        if self.size + new_items_count > self.mask + 1:
+            self._grow(self.size + new_items_count)
+
+        self._write_range(self.head_pos + self.size, new_items)
+        self.size += new_items_count
+
+    def extend_front(self, items: Iterable[int]) -> None:
+        new_items = array.array('q', items)
+        new_items_count = len(new_items)
+
+        if self.size + new_items_count > self.mask + 1:
+            self._grow(self.size + new_items_count)
+
+        self.head_pos = (self.head_pos - new_items_count) & self.mask
+        self._write_range(self.head_pos, new_items)
+        self.size += new_items_count
+
+    def pop_many_back(self, count: int) -> array.array[int]:
+        if not 0 <= count <= self.size:
+            raise ValueError('Not enough items in deque')
+
+        result = self._copy_range(self.size - count, self.size)
+        self.size -= count
+
+        return result
+
+    def pop_many_front(self, count: int) -> array.array[int]:
+        if not 0 <= count <= self.size:
+            raise ValueError('Not enough items in deque')
+
+        result = self._copy_range(0, count)
+        self.head_pos = (self.head_pos + count) & self.mask
+        self.size -= count
+
+        return result
+
+    def _copy_range(self, start: int, stop: int) -> array.array[int]:
+        capacity = self.mask + 1
+        start_pos = (self.head_pos + start) & self.mask
+        end_pos = start_pos + stop - start
+
+        if end_pos <= capacity:
+            return self.items[start_pos:end_pos]
+
+        return self.items[start_pos:] + self.items[:end_pos - capacity]
+
+    def _write_range(self, start_pos: int, new_items: array.array[int]) -> None:
+        capacity = self.mask + 1
+        start_pos &= self.mask
+        end_pos = start_pos + len(new_items)
+
+        if end_pos <= capacity:
+            self.items[start_pos:end_pos] = new_items
+            return
+
+        first_part_length = capacity - start_pos
+        self.items[start_pos:] = new_items[:first_part_length]
+        self.items[:end_pos - capacity] = new_items[first_part_length:]
+
+    def _grow(self, min_capacity: int) -> None:
+        capacity = self.mask + 1
+
+        while capacity < min_capacity:
+            capacity *= 2
+
+        items = self._copy_range(0, self.size)
+        items.frombytes(bytes((capacity - self.size) * items.itemsize))
+
+        self.items = items
+        self.mask = capacity - 1
+        self.head_pos = 0
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import collections
+import sys
+import time
+from collections.abc import Callable
+
+import a_growable
+import a_simplified
+
+
+def measure(name: str, operations_count: int, function: Callable[[], None]) -> None:
+    start_time = time.perf_counter()
+    function()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f'{name:<36} {elapsed_time:8.3f} s {operations_count / elapsed_time / 1e6:8.2f} M ops/s')
+
+
+def run_single_operations(push_back: Callable[[int], None],
+                          push_front: Callable[[int], None],
+                          pop_back: Callable[[], int],
+                          pop_front: Callable[[], int],
+                          items_count: int) -> None:
+    for i in range(items_count):
+        push_back(i)
+        push_front(i)
+
+    for i in range(items_count):
+        pop_back()
+        pop_front()
+
+
+def run_bulk_operations(items_count: int, batch_size: int) -> None:
+    deque = a_growable.GrowableDeque()
+    batch = range(batch_size)
+
+    for i in range(items_count // batch_size):
+        deque.extend_back(batch)
+        deque.extend_front(batch)
+
+    for i in range(items_count // batch_size):
+        deque.pop_many_back(batch_size)
+        deque.pop_many_front(batch_size)
+
+
+def run_collections_bulk_operations(items_count: int, batch_size: int) -> None:
+    deque: collections.deque[int] = collections.deque()
+    batch = range(batch_size)
+
+    for i in range(items_count // batch_size):
+        deque.extend(batch)
+        deque.extendleft(batch)
+
+    for i in range(items_count // batch_size):
+        [deque.pop() for _ in batch]
+        [deque.popleft() for _ in batch]
+
+
+def main() -> None:
+    items_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    batch_size = 1000
+    operations_count = items_count * 4
+
+    growable_deque = a_growable.GrowableDeque()
+    simplified_deque = a_simplified.Deque(max_size=items_count * 2)
+    collections_deque: collections.deque[int] = collections.deque()
+
+    measure('GrowableDeque', operations_count, lambda: run_single_operations(
+        growable_deque.push_back,
+        growable_deque.push_front,
+        growable_deque.pop_back,
+        growable_deque.pop_front,
+        items_count,
+    ))
+    measure('a_simplified.Deque', operations_count, lambda: run_single_operations(
+        simplified_deque.push_back,
+        simplified_deque.push_front,
+        simplified_deque.pop_back,
+        simplified_deque.pop_front,
+        items_count,
+    ))
+    measure('collections.deque', operations_count, lambda: run_single_operations(
+        collections_deque.append,
+        collections_deque.appendleft,
+        collections_deque.pop,
+        collections_deque.popleft,
+        items_count,
+    ))
+    measure(
+        f'GrowableDeque (bulk, batch {batch_size})',
+        operations_count,
+        lambda: run_bulk_operations(items_count, batch_size),
+    )
+    measure(
+        f'collections.deque (bulk, batch {batch_size})',
+        operations_count,
+        lambda: run_collections_bulk_operations(items_count, batch_size),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+# -- Принцип работы --
+#
+# Вариант калькулятора из `b_simplified.py`, в котором вычисление выражения разделено на два этапа.
+#
+# * Компиляция. Строка выражения в обратной польской нотации один раз разбивается на токены, и каждый
+#   токен превращается в код операции: `PUSH` для числа или код арифметической операции. Коды операций
+#   сохраняются в компактном массиве `array('B')`, а числа — в отдельном кортеже операндов. Во время
+#   компиляции также отслеживается глубина стека. Если выражение содержит некорректный токен или
+#   операциям не хватает чисел, то компиляция останавливается, а в программе сохраняется сообщение
+#   об ошибке. Исключение `ValueError` возникает уже при исполнении, после выполнения корректной части
+#   программы, поэтому порядок ошибок (например, деления на ноль) совпадает с исходным калькулятором.
+# * Исполнение. Скомпилированная программа выполняется простым циклом по массиву кодов операций, без
+#   регулярных выражений и без повторного разбора строки.
+#
+# Скомпилированные программы сохраняются в LRU-кеше, ключом которого является текст выражения. Поэтому
+# повторяющиеся выражения компилируются только один раз. Метод `calculate_many()` считывает выражения
+# построчно из потока байтов и вычисляет их, используя тот же кеш.
+#
+# Деление, как и в исходном калькуляторе, выполняется с округлением вниз (`//`).
+#
+# -- Временная сложность --
+#
+# Компиляция и исполнение выражения из `n` токенов выполняются за время `O(n)`. Для выражения, уже
+# находящегося в кеше, этап компиляции заменяется поиском в словаре.
+#
+# -- Пространственная сложность --
+#
+# Скомпилированная программа и стек занимают `O(n)` памяти. Кеш хранит не более `cache_size` программ.
+
+from __future__ import annotations
+
+import array
+import dataclasses
+import functools
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import BinaryIO
+
+PUSH = 0
+ADD = 1
+SUB = 2
+MUL = 3
+DIV = 4
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class CalculatorProgram:
+    opcodes: array.array[int]
+    operands: tuple[int, ...]
+    error_message: str | None = None
+
+
+class CalculatorCompiler:
+    operations: Mapping[bytes, int] = {
+        b'+': ADD,
+        b'-': SUB,
+        b'*': MUL,
+        b'/': DIV,
+    }
+
+    def compile(self, tokens_str: bytes) -> CalculatorProgram:
+        opcodes = array.array('B')
+        operands: list[int] = []
+        stack_depth = 0
+        error_message: str | None = None
+
+        for token in tokens_str.split():
+            operation = self.operations.get(token)
+
+            if operation is not None:
+                if stack_depth < 2:
+                    error_message = 'Stack is empty'
+                    break
+
+                opcodes.append(operation)
+                stack_depth -= 1
+                continue
+
+            digits = token[1:] if token[:1] == b'-' else token
+
+            if not digits.isdigit():
+                error_message = 'Invalid token'
+                break
+
+            opcodes.append(PUSH)
+            operands.append(int(token))
+            stack_depth += 1
+
+        if error_message is None and stack_depth == 0:
+            error_message = 'Stack is empty'
+
+        return CalculatorProgram(
+            opcodes=opcodes,
+            operands=tuple(operands),
+            error_message=error_message,
+        )
+
+
+def execute_program(program: CalculatorProgram) -> int:
+    stack: list[int] = []
+    push = stack.append
+    pop = stack.pop
+    operands = iter(program.operands)
+
+    for opcode in program.opcodes:
+        if opcode == PUSH:
+            push(next(operands))
+            continue
+
+        b = pop()
+        a = pop()
+
+        if opcode == ADD:
+            push(a + b)
+        elif opcode == SUB:
+            push(a - b)
+        elif opcode == MUL:
+            push(a * b)
+        else:
+            push(a // b)
+
+    if program.error_message is not None:
+        raise ValueError(program.error_message)
+
+    return stack[-1]
+
+
+class Calculator:
+    compiler: CalculatorCompiler
+    compile_cached: Callable[[bytes], CalculatorProgram]
+
+    def __init__(self, *, cache_size: int = 1024) -> None:
+        self.compiler = CalculatorCompiler()
+        self.compile_cached = functools.lru_cache(maxsize=cache_size)(self.compiler.compile)
+
+    def compile(self, tokens_str: str | bytes) -> CalculatorProgram:
+        if isinstance(tokens_str, str):
+            tokens_str = tokens_str.encode()
+
+        return self.compile_cached(tokens_str.strip())
+
+    def calculate(self, tokens_str: str | bytes) -> int:
+        return execute_program(self.compile(tokens_str))
+
+    def calculate_many(self, stream: BinaryIO | Iterable[bytes]) -> Iterator[int]:
+        for line in stream:
+            tokens_str = line.strip()
+
+            if not tokens_str:
+                continue
+
+            yield execute_program(self.compile_cached(tokens_str))
+
+
+def main() -> None:
+    calculator = Calculator()
+
+    sys.stdout.write(''.join(
+        f'{result}\n'
+        for result in calculator.calculate_many(sys.stdin.buffer)
+    ))
+
+
+if __name__ == '__main__':
+    main()
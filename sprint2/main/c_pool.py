@@ -0,0 +1,355 @@
+from __future__ import annotations
+
+import array
+import math
+import os
+from collections.abc import Iterable, Iterator
+from typing import Any, Self
+
+LOCAL = os.environ.get('REMOTE_JUDGE', 'false') != 'true'
+
+if LOCAL:
+    class Node:
+        def __init__(self, value: str, next_item: Node | None = None) -> None:
+            self.value = value
+            self.next_item = next_item
+
+
+    class DoubleConnectedNode:
+        def __init__(self,
+                     value: str,
+                     next: DoubleConnectedNode | None = None,
+                     prev: DoubleConnectedNode | None = None) -> None:
+            self.value = value
+            self.next = next
+            self.prev = prev
+
+
+NIL = -1
+FREED = -2
+
+
+class LinkedListPool:
+    values: list[Any]
+    nodes: list[Any]
+    next_handles: array.array[int]
+    prev_handles: array.array[int]
+    free_handles: array.array[int]
+    head: int
+    tail: int
+    size: int
+
+    next_attribute: str
+    prev_attribute: str | None
+    node_class: type | None
+
+    # Индекс для поиска по позиции: список разбит на блоки, для каждого блока хранятся его первый
+    # элемент и размер, а для каждого дескриптора — признак того, что он начинает блок. Разворот
+    # списка меняет порядок блоков, поэтому после `reverse()` индекс перестраивается при следующем
+    # обращении по позиции за `O(n)`.
+    block_heads: list[int]
+    block_sizes: list[int]
+    block_head_flags: bytearray
+    block_size: int
+    is_index_valid: bool
+
+    def __init__(self, *, next_attribute: str = 'next_item', prev_attribute: str | None = None) -> None:
+        self.values = []
+        self.nodes = []
+        self.next_handles = array.array('q')
+        self.prev_handles = array.array('q')
+        self.free_handles = array.array('q')
+        self.head = self.tail = NIL
+        self.size = 0
+
+        self.next_attribute = next_attribute
+        self.prev_attribute = prev_attribute
+        self.node_class = None
+
+        self.block_heads = []
+        self.block_sizes = []
+        self.block_head_flags = bytearray()
+        self.block_size = 1
+        self.is_index_valid = True
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Any]:
+        values = self.values
+
+        for handle in self.iter_handles():
+            yield values[handle]
+
+    def iter_handles(self) -> Iterator[int]:
+        next_handles = self.next_handles
+        handle = self.head
+
+        while handle != NIL:
+            yield handle
+            handle = next_handles[handle]
+
+    def append(self, value: Any, node: Any = None) -> int:
+        if self.free_handles:
+            handle = self.free_handles.pop()
+            self.values[handle] = value
+            self.nodes[handle] = node
+            self.next_handles[handle] = NIL
+            self.prev_handles[handle] = self.tail
+        else:
+            handle = len(self.values)
+            self.values.append(value)
+            self.nodes.append(node)
+            self.next_handles.append(NIL)
+            self.prev_handles.append(self.tail)
+            self.block_head_flags.append(0)
+
+        if self.tail == NIL:
+            self.head = handle
+        else:
+            self.next_handles[self.tail] = handle
+
+        self.tail = handle
+        self.size += 1
+
+        if self.is_index_valid:
+            if self.block_sizes and self.block_sizes[-1] < self.block_size:
+                self.block_sizes[-1] += 1
+            elif len(self.block_sizes) < 2 * self.block_size:
+                self.block_heads.append(handle)
+                self.block_sizes.append(1)
+                self.block_head_flags[handle] = 1
+            else:
+                self.is_index_valid = False
+
+        return handle
+
+    def extend(self, values: Iterable[Any]) -> None:
+        for value in values:
+            self.append(value)
+
+    def unlink(self, handle: int) -> None:
+        if not 0 <= handle < len(self.values) or self.next_handles[handle] == FREED:
+            raise ValueError('Invalid handle')
+
+        if self.is_index_valid:
+            # Начало блока ищется движением назад по списку, что занимает не более `O(√n)` шагов.
+            block_head = handle
+
+            while not self.block_head_flags[block_head]:
+                block_head = self.prev_handles[block_head]
+
+            self._remove_from_block(self.block_heads.index(block_head), handle)
+
+        self._unlink(handle)
+
+    def get_handle(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            return NIL
+
+        block_num, handle_index = self._find_block(index)
+        handle = self.block_heads[block_num]
+        next_handles = self.next_handles
+
+        for _i in range(handle_index):
+            handle = next_handles[handle]
+
+        return handle
+
+    def remove_at(self, index: int) -> bool:
+        if not 0 <= index < self.size:
+            return False
+
+        block_num, handle_index = self._find_block(index)
+        handle = self.block_heads[block_num]
+        next_handles = self.next_handles
+
+        for _i in range(handle_index):
+            handle = next_handles[handle]
+
+        self._remove_from_block(block_num, handle)
+        self._unlink(handle)
+
+        return True
+
+    def find(self, value: Any) -> int:
+        for i, handle_value in enumerate(self):
+            if handle_value == value:
+                return i
+
+        return -1
+
+    def reverse(self) -> None:
+        # Развернуть двусвязный список — значит поменять ролями ссылки на следующий и предыдущий
+        # элементы, поэтому достаточно поменять местами сами массивы ссылок.
+        self.next_handles, self.prev_handles = self.prev_handles, self.next_handles
+        self.head, self.tail = self.tail, self.head
+        self.is_index_valid = False
+
+    def rebuild_index(self) -> None:
+        self.block_size = max(math.isqrt(self.size), 1)
+        self.block_heads = []
+        self.block_sizes = []
+        self.block_head_flags = bytearray(len(self.values))
+
+        for i, handle in enumerate(self.iter_handles()):
+            if i % self.block_size == 0:
+                self.block_heads.append(handle)
+                self.block_sizes.append(0)
+                self.block_head_flags[handle] = 1
+
+            self.block_sizes[-1] += 1
+
+        self.is_index_valid = True
+
+    def to_nodes(self) -> Any:
+        next_attribute = self.next_attribute
+        prev_attribute = self.prev_attribute
+        head_node = previous_node = None
+
+        for handle in self.iter_handles():
+            node = self.nodes[handle]
+
+            if node is None:
+                if self.node_class is None:
+                    raise ValueError('Node class is unknown')
+
+                node = self.nodes[handle] = self.node_class(self.values[handle])
+
+            if previous_node is None:
+                head_node = node
+            else:
+                setattr(previous_node, next_attribute, node)
+
+            if prev_attribute is not None:
+                setattr(node, prev_attribute, previous_node)
+
+            previous_node = node
+
+        if previous_node is not None:
+            setattr(previous_node, next_attribute, None)
+
+        return head_node
+
+    @classmethod
+    def from_nodes(cls, head: Any, *, next_attribute: str = 'next_item', prev_attribute: str | None = None) -> Self:
+        pool = cls(next_attribute=next_attribute, prev_attribute=prev_attribute)
+
+        if head is not None:
+            pool.node_class = type(head)
+
+        node = head
+
+        while node is not None:
+            pool.append(node.value, node)
+            node = getattr(node, next_attribute)
+
+        return pool
+
+    def _find_block(self, index: int) -> tuple[int, int]:
+        if not self.is_index_valid:
+            self.rebuild_index()
+
+        for block_num, block_size in enumerate(self.block_sizes):
+            if index < block_size:
+                return block_num, index
+
+            index -= block_size
+
+        raise IndexError('Linked list index out of range')
+
+    def _remove_from_block(self, block_num: int, handle: int) -> None:
+        if self.block_heads[block_num] == handle:
+            self.block_head_flags[handle] = 0
+
+            if self.block_sizes[block_num] == 1:
+                del self.block_heads[block_num]
+                del self.block_sizes[block_num]
+                return
+
+            next_handle = self.next_handles[handle]
+            self.block_heads[block_num] = next_handle
+            self.block_head_flags[next_handle] = 1
+
+        self.block_sizes[block_num] -= 1
+
+    def _unlink(self, handle: int) -> None:
+        next_handle = self.next_handles[handle]
+        prev_handle = self.prev_handles[handle]
+
+        if prev_handle == NIL:
+            self.head = next_handle
+        else:
+            self.next_handles[prev_handle] = next_handle
+
+        if next_handle == NIL:
+            self.tail = prev_handle
+        else:
+            self.prev_handles[next_handle] = prev_handle
+
+        self.values[handle] = self.nodes[handle] = None
+        self.next_handles[handle] = self.prev_handles[handle] = FREED
+        self.free_handles.append(handle)
+        self.size -= 1
+
+
+def solution(node: Node, idx: int) -> Node | None:
+    return remove_node(node, idx)
+
+
+def remove_node(node: Node, index: int) -> Node | None:
+    pool = LinkedListPool.from_nodes(node)
+    pool.remove_at(index)
+    return pool.to_nodes()
+
+
+def find_node(node: Node, value: str) -> int:
+    return LinkedListPool.from_nodes(node).find(value)
+
+
+def reverse_linked_list(node: DoubleConnectedNode) -> DoubleConnectedNode:
+    pool = LinkedListPool.from_nodes(node, next_attribute='next', prev_attribute='prev')
+    pool.reverse()
+    return pool.to_nodes()
+
+
+def test() -> None:
+    node3 = Node('node3', None)
+    node2 = Node('node2', node3)
+    node1 = Node('node1', node2)
+    node0 = Node('node0', node1)
+
+    assert find_node(node0, 'node2') == 2
+    assert find_node(node0, 'node4') == -1
+
+    new_head = solution(node0, 1)
+
+    assert new_head is node0
+    assert new_head.next_item is node2
+    assert new_head.next_item.next_item is node3
+    assert new_head.next_item.next_item.next_item is None
+
+    double_node3 = DoubleConnectedNode('node3')
+    double_node2 = DoubleConnectedNode('node2', double_node3)
+    double_node1 = DoubleConnectedNode('node1', double_node2)
+    double_node0 = DoubleConnectedNode('node0', double_node1)
+
+    double_node1.prev = double_node0
+    double_node2.prev = double_node1
+    double_node3.prev = double_node2
+
+    new_double_head = reverse_linked_list(double_node0)
+
+    assert new_double_head is double_node3
+    assert double_node3.prev is None
+    assert double_node3.next is double_node2
+    assert double_node2.next is double_node1
+    assert double_node2.prev is double_node3
+    assert double_node1.next is double_node0
+    assert double_node1.prev is double_node2
+    assert double_node0.prev is double_node1
+    assert double_node0.next is None
+
+
+if __name__ == '__main__':
+    test()
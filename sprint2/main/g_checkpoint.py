@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import array
+import sys
+from collections.abc import Iterable
+
+type UndoRecord = tuple[int, int, int, int, int]
+
+
+class StackMaxCheckpointed:
+    # Массивы хранят значения для каждой глубины стека: сам элемент, а также максимум, минимум и сумму
+    # элементов от дна стека до этой глубины. Снятые элементы физически не удаляются, а отсекаются
+    # счетчиком `size`.
+    items: array.array[int]
+    max_items: array.array[int]
+    min_items: array.array[int]
+    sums: list[int]
+    size: int
+
+    # Контрольная точка хранит размер стека и длину журнала перезаписанных ячеек на момент ее создания.
+    checkpoints: list[tuple[int, int]]
+    undo_log: list[UndoRecord]
+
+    def __init__(self, items: Iterable[int] | None = None) -> None:
+        self.items = array.array('q')
+        self.max_items = array.array('q')
+        self.min_items = array.array('q')
+        self.sums = []
+        self.size = 0
+
+        self.checkpoints = []
+        self.undo_log = []
+
+        for item in items or []:
+            self.push(item)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, item: int) -> None:
+        size = self.size
+        items = self.items
+
+        if size:
+            max_item = self.max_items[size - 1]
+            min_item = self.min_items[size - 1]
+            items_sum = self.sums[size - 1] + item
+
+            if item > max_item:
+                max_item = item
+            elif item < min_item:
+                min_item = item
+        else:
+            max_item = min_item = items_sum = item
+
+        if size == len(items):
+            items.append(item)
+            self.max_items.append(max_item)
+            self.min_items.append(min_item)
+            self.sums.append(items_sum)
+        else:
+            if self.checkpoints:
+                self.undo_log.append((
+                    size,
+                    items[size],
+                    self.max_items[size],
+                    self.min_items[size],
+                    self.sums[size],
+                ))
+
+            items[size] = item
+            self.max_items[size] = max_item
+            self.min_items[size] = min_item
+            self.sums[size] = items_sum
+
+        self.size = size + 1
+
+    def pop(self) -> int:
+        if not self.size:
+            raise ValueError('Stack is empty')
+
+        self.size -= 1
+
+        return self.items[self.size]
+
+    def get_top(self) -> int:
+        if not self.size:
+            raise ValueError('Stack is empty')
+
+        return self.items[self.size - 1]
+
+    def get_max(self) -> int | None:
+        if not self.size:
+            return None
+
+        return self.max_items[self.size - 1]
+
+    def get_min(self) -> int | None:
+        if not self.size:
+            return None
+
+        return self.min_items[self.size - 1]
+
+    def get_sum(self) -> int:
+        if not self.size:
+            return 0
+
+        return self.sums[self.size - 1]
+
+    def checkpoint(self) -> int:
+        self.checkpoints.append((self.size, len(self.undo_log)))
+        return len(self.checkpoints) - 1
+
+    def rollback(self, token: int) -> None:
+        self._check_token(token)
+
+        size, undo_log_length = self.checkpoints[token]
+        undo_log = self.undo_log
+
+        while len(undo_log) > undo_log_length:
+            pos, item, max_item, min_item, items_sum = undo_log.pop()
+
+            self.items[pos] = item
+            self.max_items[pos] = max_item
+            self.min_items[pos] = min_item
+            self.sums[pos] = items_sum
+
+        self.size = size
+        self._release_checkpoints(token)
+
+    def release(self, token: int) -> None:
+        self._check_token(token)
+        self._release_checkpoints(token)
+
+    def _check_token(self, token: int) -> None:
+        if not 0 <= token < len(self.checkpoints):
+            raise ValueError('Invalid checkpoint')
+
+    def _release_checkpoints(self, token: int) -> None:
+        del self.checkpoints[token:]
+
+        if not self.checkpoints:
+            self.undo_log.clear()
+
+            # Без активных контрольных точек снятые элементы больше не нужны, поэтому массивы
+            # обрезаются до текущего размера стека.
+            del self.items[self.size:]
+            del self.max_items[self.size:]
+            del self.min_items[self.size:]
+            del self.sums[self.size:]
+
+
+def main() -> None:
+    tokens = sys.stdin.buffer.read().split()
+    commands_count = int(tokens[0])
+
+    stack = StackMaxCheckpointed()
+    results: list[str] = []
+    pos = 1
+
+    for i in range(commands_count):
+        command_name = tokens[pos]
+        pos += 1
+
+        if command_name == b'push':
+            stack.push(int(tokens[pos]))
+            pos += 1
+        elif command_name == b'pop':
+            try:
+                stack.pop()
+            except ValueError:
+                results.append('error')
+        elif command_name == b'top':
+            try:
+                results.append(str(stack.get_top()))
+            except ValueError:
+                results.append('error')
+        elif command_name == b'get_max':
+            results.append(str(stack.get_max()))
+
+    if results:
+        sys.stdout.write('\n'.join(results) + '\n')
+
+
+if __name__ == '__main__':
+    main()
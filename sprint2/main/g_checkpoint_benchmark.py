@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+import g
+import g_checkpoint
+
+
+def measure(name: str, operations_count: int, function: Callable[[], object]) -> None:
+    start_time = time.perf_counter()
+    function()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f'{name:<36} {elapsed_time:8.3f} s {operations_count / elapsed_time / 1e6:8.2f} M ops/s')
+
+
+def run_push_pop(push: Callable[[int], None], pop: Callable[[], int], items: Sequence[int]) -> None:
+    for item in items:
+        push(item)
+
+    for _item in items:
+        pop()
+
+
+def run_backtracking_effective(items: Sequence[int], *, depth: int) -> None:
+    stack = g.StackMaxEffective()
+
+    for i in range(0, len(items), depth):
+        branch = items[i:i + depth]
+
+        for item in branch:
+            stack.push(item)
+            stack.get_max()
+
+        for _item in branch:
+            stack.pop()
+
+
+def run_backtracking_checkpointed(items: Sequence[int], *, depth: int) -> None:
+    stack = g_checkpoint.StackMaxCheckpointed()
+
+    for i in range(0, len(items), depth):
+        token = stack.checkpoint()
+
+        for item in items[i:i + depth]:
+            stack.push(item)
+            stack.get_max()
+
+        stack.rollback(token)
+
+
+def main() -> None:
+    operations_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    items = [random.randint(-10 ** 9, 10 ** 9) for _ in range(operations_count // 2)]
+
+    stack_effective = g.StackMaxEffective()
+    stack_checkpointed = g_checkpoint.StackMaxCheckpointed()
+
+    measure('StackMaxEffective push/pop', operations_count, lambda: run_push_pop(
+        stack_effective.push,
+        stack_effective.pop,
+        items,
+    ))
+    measure('StackMaxCheckpointed push/pop', operations_count, lambda: run_push_pop(
+        stack_checkpointed.push,
+        stack_checkpointed.pop,
+        items,
+    ))
+
+    for depth in [10, 100, 1000]:
+        print(f'backtracking depth: {depth}')
+
+        measure('StackMaxEffective pop to restore', operations_count, lambda: run_backtracking_effective(
+            items,
+            depth=depth,
+        ))
+        measure('StackMaxCheckpointed rollback', operations_count, lambda: run_backtracking_checkpointed(
+            items,
+            depth=depth,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import array
+import itertools
+import sys
+from collections import deque
+from collections.abc import Iterable, Sequence
+
+
+class MonotonicQueue:
+    items: deque[int]
+    max_items: deque[int]
+    min_items: deque[int]
+
+    def __init__(self, items: Iterable[int] | None = None) -> None:
+        self.items = deque()
+        self.max_items = deque()
+        self.min_items = deque()
+
+        for item in items or []:
+            self.push(item)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def push(self, item: int) -> None:
+        self.items.append(item)
+
+        while self.max_items and self.max_items[-1] < item:
+            self.max_items.pop()
+
+        self.max_items.append(item)
+
+        while self.min_items and self.min_items[-1] > item:
+            self.min_items.pop()
+
+        self.min_items.append(item)
+
+    def pop_front(self) -> int:
+        if not self.items:
+            raise ValueError('Queue is empty')
+
+        item = self.items.popleft()
+
+        if item == self.max_items[0]:
+            self.max_items.popleft()
+
+        if item == self.min_items[0]:
+            self.min_items.popleft()
+
+        return item
+
+    def get_max(self) -> int | None:
+        if not self.max_items:
+            return None
+
+        return self.max_items[0]
+
+    def get_min(self) -> int | None:
+        if not self.min_items:
+            return None
+
+        return self.min_items[0]
+
+
+def window_max(values: Sequence[int], window_size: int) -> array.array[int]:
+    return _get_window_extremes(values, window_size, is_max=True)
+
+
+def window_min(values: Sequence[int], window_size: int) -> array.array[int]:
+    return _get_window_extremes(values, window_size, is_max=False)
+
+
+def _get_window_extremes(values: Sequence[int], window_size: int, *, is_max: bool) -> array.array[int]:
+    if window_size <= 0:
+        raise ValueError('Invalid window size')
+
+    result = array.array('q')
+    candidates: deque[int] = deque()
+    append_result = result.append
+
+    for i, value in enumerate(values):
+        if is_max:
+            while candidates and values[candidates[-1]] <= value:
+                candidates.pop()
+        else:
+            while candidates and values[candidates[-1]] >= value:
+                candidates.pop()
+
+        candidates.append(i)
+
+        if candidates[0] <= i - window_size:
+            candidates.popleft()
+
+        if i >= window_size - 1:
+            append_result(values[candidates[0]])
+
+    return result
+
+
+def main() -> None:
+    values_count = int(input().strip())
+    values = array.array('q', itertools.islice(
+        map(int, sys.stdin.readline().split()),
+        values_count,
+    ))
+    window_size = int(input().strip())
+
+    print(*window_max(values, window_size))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import array
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+import g_monotonic_queue
+
+
+def window_max_naive(values: Sequence[int], window_size: int) -> Sequence[int]:
+    return [max(values[i:i + window_size]) for i in range(len(values) - window_size + 1)]
+
+
+def window_max_queue(values: Sequence[int], window_size: int) -> Sequence[int]:
+    queue = g_monotonic_queue.MonotonicQueue()
+    result: list[int] = []
+
+    for value in values:
+        queue.push(value)
+
+        if len(queue) > window_size:
+            queue.pop_front()
+
+        if len(queue) == window_size:
+            result.append(queue.get_max())
+
+    return result
+
+
+def measure(name: str, values_count: int, function: Callable[[], Sequence[int]]) -> Sequence[int]:
+    start_time = time.perf_counter()
+    result = function()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f'{name:<32} {elapsed_time:8.3f} s {values_count / elapsed_time / 1e6:8.2f} M values/s')
+
+    return result
+
+
+def main() -> None:
+    values_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 5
+    values = array.array('q', (random.randint(-10 ** 9, 10 ** 9) for _ in range(values_count)))
+
+    for window_size in [10, 100, 1000]:
+        print(f'window size: {window_size}')
+
+        result_naive = measure('naive rescanning', values_count, lambda: window_max_naive(
+            values,
+            window_size,
+        ))
+        result_queue = measure('MonotonicQueue', values_count, lambda: window_max_queue(
+            values,
+            window_size,
+        ))
+        result_window_max = measure('window_max()', values_count, lambda: g_monotonic_queue.window_max(
+            values,
+            window_size,
+        ))
+
+        assert list(result_naive) == list(result_queue) == list(result_window_max)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import dataclasses
+import io
+import sys
+from typing import BinaryIO
+
+BLOCK_SIZE = 1 << 22
+
+OPEN_BRACKETS = b'([{'
+CLOSE_BRACKETS = b')]}'
+BRACKETS = OPEN_BRACKETS + CLOSE_BRACKETS
+
+BRACKET_CODES = bytes.maketrans(BRACKETS, bytes(range(1, len(BRACKETS) + 1)))
+NON_BRACKET_BYTES = bytes(byte for byte in range(256) if byte not in BRACKETS)
+CLOSE_BRACKET_CODES_OFFSET = len(OPEN_BRACKETS)
+
+
+@dataclasses.dataclass(kw_only=True)
+class BracketValidationResult:
+    is_correct: bool
+    error_offset: int | None
+    max_depth: int
+
+
+class BracketStreamValidator:
+    ignore_other_bytes: bool
+
+    stack: bytearray
+    max_depth: int
+    offset: int
+    error_offset: int | None
+
+    def __init__(self, *, ignore_other_bytes: bool = True) -> None:
+        self.ignore_other_bytes = ignore_other_bytes
+
+        self.stack = bytearray()
+        self.max_depth = self.offset = 0
+        self.error_offset = None
+
+    def feed(self, block: bytes) -> bool:
+        if self.error_offset is not None:
+            return False
+
+        invalid_pos: int | None = None
+
+        if not self.ignore_other_bytes:
+            invalid_pos = self._find_non_bracket(block)
+
+            if invalid_pos is not None:
+                block = block[:invalid_pos]
+
+        codes = block.translate(BRACKET_CODES, NON_BRACKET_BYTES)
+        mismatch_index = self._process_codes(codes)
+
+        if mismatch_index is not None:
+            self.error_offset = self.offset + self._find_bracket_pos(block, mismatch_index)
+            return False
+
+        if invalid_pos is not None:
+            self.error_offset = self.offset + invalid_pos
+            return False
+
+        self.offset += len(block)
+        return True
+
+    def finish(self) -> BracketValidationResult:
+        if self.error_offset is None and self.stack:
+            self.error_offset = self.offset
+
+        return BracketValidationResult(
+            is_correct=self.error_offset is None,
+            error_offset=self.error_offset,
+            max_depth=self.max_depth,
+        )
+
+    def _process_codes(self, codes: bytes) -> int | None:
+        stack = self.stack
+        push = stack.append
+        pop = stack.pop
+        depth = len(stack)
+        max_depth = self.max_depth
+
+        for i, code in enumerate(codes):
+            if code <= CLOSE_BRACKET_CODES_OFFSET:
+                push(code)
+                depth += 1
+
+                if depth > max_depth:
+                    max_depth = depth
+
+                continue
+
+            if not depth or pop() != code - CLOSE_BRACKET_CODES_OFFSET:
+                self.max_depth = max_depth
+                return i
+
+            depth -= 1
+
+        self.max_depth = max_depth
+        return None
+
+    @staticmethod
+    def _find_non_bracket(block: bytes) -> int | None:
+        if not block.translate(None, BRACKETS):
+            return None
+
+        for i, byte in enumerate(block):
+            if byte not in BRACKETS:
+                return i
+
+        return None
+
+    @staticmethod
+    def _find_bracket_pos(block: bytes, bracket_index: int) -> int:
+        for i, byte in enumerate(block):
+            if byte not in BRACKETS:
+                continue
+
+            if bracket_index == 0:
+                return i
+
+            bracket_index -= 1
+
+        raise ValueError('Bracket not found')
+
+
+def validate_stream(stream: BinaryIO,
+                    *,
+                    ignore_other_bytes: bool = True,
+                    block_size: int = BLOCK_SIZE) -> BracketValidationResult:
+    validator = BracketStreamValidator(ignore_other_bytes=ignore_other_bytes)
+
+    while block := stream.read(block_size):
+        if not validator.feed(block):
+            break
+
+    return validator.finish()
+
+
+def validate_file(path: str,
+                  *,
+                  ignore_other_bytes: bool = True,
+                  block_size: int = BLOCK_SIZE) -> BracketValidationResult:
+    with open(path, 'rb') as stream:
+        return validate_stream(stream, ignore_other_bytes=ignore_other_bytes, block_size=block_size)
+
+
+def main() -> None:
+    # Как и в `h.py`, проверяется только первая строка без пробельных символов по краям, а любые
+    # символы, кроме скобок, делают последовательность некорректной.
+    bracket_bytes = sys.stdin.buffer.readline().strip()
+    result = validate_stream(io.BytesIO(bracket_bytes), ignore_other_bytes=False)
+    print(result.is_correct)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+
+
+class MyQueueSized:
+    max_size: int
+
+    items: list[int]
+    head_pos: int
+    tail_pos: int
+    size: int
+
+    def __init__(self, *, max_size: int) -> None:
+        self.max_size = max_size
+
+        self.items = []
+        self.head_pos = self.tail_pos = self.size = 0
+
+    def get_size(self) -> int:
+        return self.size
+
+    def push(self, item: int) -> None:
+        if len(self.items) < self.max_size:
+            self.items.append(item)
+            self.tail_pos += 1
+            self.size += 1
+            return
+
+        if self.size == self.max_size:
+            raise ValueError('Queue max size exceeded')
+
+        if self.tail_pos == self.max_size:
+            self.tail_pos = 0
+
+        self.items[self.tail_pos] = item
+        self.tail_pos += 1
+        self.size += 1
+
+    def pop(self) -> int:
+        if not self.size:
+            raise ValueError('Queue is empty')
+
+        item = self.items[self.head_pos]
+        self.head_pos += 1
+        self.size -= 1
+
+        if self.head_pos == self.max_size:
+            self.head_pos = 0
+
+            if self.tail_pos == self.max_size:
+                self.tail_pos = 0
+
+        return item
+
+    def peek(self) -> int:
+        if not self.size:
+            raise ValueError('Queue is empty')
+
+        return self.items[self.head_pos]
+
+
+class PartialPutTimeoutError(TimeoutError):
+    # Пакет элементов добавляется в очередь частями, поэтому при истечении времени ожидания часть
+    # элементов может уже находиться в очереди.
+    enqueued_count: int
+
+    def __init__(self, message: str, *, enqueued_count: int) -> None:
+        super().__init__(message)
+        self.enqueued_count = enqueued_count
+
+
+class BlockingQueueSized:
+    queue: MyQueueSized
+    lock: threading.Lock
+    not_empty: threading.Condition
+    not_full: threading.Condition
+
+    def __init__(self, *, max_size: int) -> None:
+        self.queue = MyQueueSized(max_size=max_size)
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def get_size(self) -> int:
+        with self.lock:
+            return self.queue.get_size()
+
+    def put(self, item: int, *, timeout: float | None = None) -> None:
+        with self.not_full:
+            if not self.not_full.wait_for(self._has_free_space, timeout):
+                raise TimeoutError('Queue is full')
+
+            self.queue.push(item)
+            self.not_empty.notify()
+
+    def get(self, *, timeout: float | None = None) -> int:
+        with self.not_empty:
+            if not self.not_empty.wait_for(self._has_items, timeout):
+                raise TimeoutError('Queue is empty')
+
+            item = self.queue.pop()
+            self.not_full.notify()
+
+        return item
+
+    def put_many(self, items: Iterable[int], *, timeout: float | None = None) -> int:
+        items_list = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pos = 0
+
+        while pos < len(items_list):
+            with self.not_full:
+                remaining_time = None if deadline is None else deadline - time.monotonic()
+
+                if not self.not_full.wait_for(self._has_free_space, remaining_time):
+                    raise PartialPutTimeoutError('Queue is full', enqueued_count=pos)
+
+                free_space = self.queue.max_size - self.queue.get_size()
+                batch_end = min(pos + free_space, len(items_list))
+
+                for i in range(pos, batch_end):
+                    self.queue.push(items_list[i])
+
+                self.not_empty.notify(batch_end - pos)
+                pos = batch_end
+
+        return pos
+
+    def get_many(self, max_count: int, *, timeout: float | None = None) -> Sequence[int]:
+        with self.not_empty:
+            if not self.not_empty.wait_for(self._has_items, timeout):
+                raise TimeoutError('Queue is empty')
+
+            items = [self.queue.pop() for _ in range(min(max_count, self.queue.get_size()))]
+            self.not_full.notify(len(items))
+
+        return items
+
+    def _has_items(self) -> bool:
+        return self.queue.get_size() > 0
+
+    def _has_free_space(self) -> bool:
+        return self.queue.get_size() < self.queue.max_size
+
+
+class AsyncQueueSized:
+    queue: MyQueueSized
+    not_empty: asyncio.Condition
+    not_full: asyncio.Condition
+
+    def __init__(self, *, max_size: int) -> None:
+        self.queue = MyQueueSized(max_size=max_size)
+
+        lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(lock)
+        self.not_full = asyncio.Condition(lock)
+
+    def get_size(self) -> int:
+        return self.queue.get_size()
+
+    async def put(self, item: int, *, timeout: float | None = None) -> None:
+        async with self.not_full:
+            await self._wait_for(self.not_full, self._has_free_space, timeout, 'Queue is full')
+
+            self.queue.push(item)
+            self.not_empty.notify()
+
+    async def get(self, *, timeout: float | None = None) -> int:
+        async with self.not_empty:
+            await self._wait_for(self.not_empty, self._has_items, timeout, 'Queue is empty')
+
+            item = self.queue.pop()
+            self.not_full.notify()
+
+        return item
+
+    async def put_many(self, items: Iterable[int], *, timeout: float | None = None) -> int:
+        items_list = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pos = 0
+
+        while pos < len(items_list):
+            async with self.not_full:
+                remaining_time = None if deadline is None else deadline - time.monotonic()
+
+                try:
+                    await self._wait_for(self.not_full, self._has_free_space, remaining_time, 'Queue is full')
+                except TimeoutError:
+                    raise PartialPutTimeoutError('Queue is full', enqueued_count=pos) from None
+
+                free_space = self.queue.max_size - self.queue.get_size()
+                batch_end = min(pos + free_space, len(items_list))
+
+                for i in range(pos, batch_end):
+                    self.queue.push(items_list[i])
+
+                self.not_empty.notify(batch_end - pos)
+                pos = batch_end
+
+        return pos
+
+    async def get_many(self, max_count: int, *, timeout: float | None = None) -> Sequence[int]:
+        async with self.not_empty:
+            await self._wait_for(self.not_empty, self._has_items, timeout, 'Queue is empty')
+
+            items = [self.queue.pop() for _ in range(min(max_count, self.queue.get_size()))]
+            self.not_full.notify(len(items))
+
+        return items
+
+    @staticmethod
+    async def _wait_for(condition: asyncio.Condition,
+                        predicate: Callable[[], bool],
+                        timeout: float | None,
+                        error_message: str) -> None:
+        # Если условие уже выполнено, ожидание не нужно: так нулевой таймаут ведет себя как в потоковой
+        # версии, а на каждую операцию не создается отдельная задача.
+        if predicate():
+            return
+
+        try:
+            async with asyncio.timeout(timeout):
+                await condition.wait_for(predicate)
+        except TimeoutError:
+            raise TimeoutError(error_message) from None
+
+    def _has_items(self) -> bool:
+        return self.queue.get_size() > 0
+
+    def _has_free_space(self) -> bool:
+        return self.queue.get_size() < self.queue.max_size
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import queue
+import sys
+import threading
+import time
+from collections.abc import Callable
+
+import i_blocking
+
+MAX_SIZE = 1024
+BATCH_SIZE = 64
+
+
+def run_threads(producer: Callable[[int], None], consumer: Callable[[int], None], *, workers_count: int,
+                items_count: int) -> float:
+    items_per_worker = items_count // workers_count
+    threads = [
+        threading.Thread(target=producer, args=(items_per_worker,))
+        for i in range(workers_count)
+    ] + [
+        threading.Thread(target=consumer, args=(items_per_worker,))
+        for i in range(workers_count)
+    ]
+
+    start_time = time.perf_counter()
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return time.perf_counter() - start_time
+
+
+def measure_queue(*, workers_count: int, items_count: int) -> float:
+    items_queue: queue.Queue[int] = queue.Queue(maxsize=MAX_SIZE)
+
+    def producer(count: int) -> None:
+        for item in range(count):
+            items_queue.put(item)
+
+    def consumer(count: int) -> None:
+        for i in range(count):
+            items_queue.get()
+
+    return run_threads(producer, consumer, workers_count=workers_count, items_count=items_count)
+
+
+def measure_blocking_queue(*, workers_count: int, items_count: int) -> float:
+    items_queue = i_blocking.BlockingQueueSized(max_size=MAX_SIZE)
+
+    def producer(count: int) -> None:
+        for item in range(count):
+            items_queue.put(item)
+
+    def consumer(count: int) -> None:
+        for i in range(count):
+            items_queue.get()
+
+    return run_threads(producer, consumer, workers_count=workers_count, items_count=items_count)
+
+
+def measure_blocking_queue_batched(*, workers_count: int, items_count: int) -> float:
+    items_queue = i_blocking.BlockingQueueSized(max_size=MAX_SIZE)
+
+    def producer(count: int) -> None:
+        for start in range(0, count, BATCH_SIZE):
+            items_queue.put_many(range(start, min(start + BATCH_SIZE, count)))
+
+    def consumer(count: int) -> None:
+        while count > 0:
+            count -= len(items_queue.get_many(min(BATCH_SIZE, count)))
+
+    return run_threads(producer, consumer, workers_count=workers_count, items_count=items_count)
+
+
+def main() -> None:
+    items_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 5
+
+    for workers_count in [1, 2, 4, 8, 16]:
+        print(f'producers/consumers: {workers_count}')
+
+        for name, function in [
+            ('queue.Queue', measure_queue),
+            ('BlockingQueueSized', measure_blocking_queue),
+            (f'BlockingQueueSized (batch {BATCH_SIZE})', measure_blocking_queue_batched),
+        ]:
+            elapsed_time = function(workers_count=workers_count, items_count=items_count)
+            print(f'{name:<32} {elapsed_time:8.3f} s {items_count / elapsed_time / 1e6:8.2f} M items/s')
+
+
+if __name__ == '__main__':
+    main()
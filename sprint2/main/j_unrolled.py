@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import array
+import sys
+
+
+class QueueBlock:
+    items: array.array[int]
+    next_block: QueueBlock | None
+
+    def __init__(self, *, block_size: int) -> None:
+        self.items = array.array('q', bytes(block_size * 8))
+        self.next_block = None
+
+
+class UnrolledQueue:
+    block_size: int
+    max_free_blocks: int
+
+    head_block: QueueBlock
+    tail_block: QueueBlock
+    head_pos: int
+    tail_pos: int
+    size: int
+    free_blocks: list[QueueBlock]
+
+    def __init__(self, *, block_size: int = 1024, max_free_blocks: int = 16) -> None:
+        self.block_size = block_size
+        self.max_free_blocks = max_free_blocks
+
+        self.head_block = self.tail_block = QueueBlock(block_size=self.block_size)
+        self.head_pos = self.tail_pos = self.size = 0
+        self.free_blocks = []
+
+    def get_size(self) -> int:
+        return self.size
+
+    def put(self, value: int) -> None:
+        if self.tail_pos == self.block_size:
+            tail_block = self._allocate_block()
+            self.tail_block.next_block = tail_block
+            self.tail_block = tail_block
+            self.tail_pos = 0
+
+        self.tail_block.items[self.tail_pos] = value
+        self.tail_pos += 1
+        self.size += 1
+
+    def get(self) -> int:
+        if not self.size:
+            raise ValueError('Queue is empty')
+
+        value = self.head_block.items[self.head_pos]
+        self.head_pos += 1
+        self.size -= 1
+
+        if not self.size:
+            if self.head_block is not self.tail_block:
+                self._release_block(self.head_block)
+                self.head_block = self.tail_block
+
+            self.head_pos = self.tail_pos = 0
+        elif self.head_pos == self.block_size:
+            head_block = self.head_block
+            self.head_block = head_block.next_block or self.tail_block
+            self.head_pos = 0
+            self._release_block(head_block)
+
+        return value
+
+    def _allocate_block(self) -> QueueBlock:
+        if self.free_blocks:
+            return self.free_blocks.pop()
+
+        return QueueBlock(block_size=self.block_size)
+
+    def _release_block(self, block: QueueBlock) -> None:
+        block.next_block = None
+
+        if len(self.free_blocks) < self.max_free_blocks:
+            self.free_blocks.append(block)
+
+
+def main() -> None:
+    tokens = sys.stdin.buffer.read().split()
+    commands_count = int(tokens[0])
+
+    queue = UnrolledQueue()
+    results: list[str] = []
+    pos = 1
+
+    for i in range(commands_count):
+        command_name = tokens[pos]
+        pos += 1
+
+        if command_name == b'put':
+            queue.put(int(tokens[pos]))
+            pos += 1
+        elif command_name == b'get':
+            try:
+                results.append(str(queue.get()))
+            except ValueError:
+                results.append('error')
+        elif command_name == b'size':
+            results.append(str(queue.get_size()))
+
+    if results:
+        sys.stdout.write('\n'.join(results) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import collections
+import sys
+import time
+from collections.abc import Callable
+
+import j
+import j_unrolled
+
+
+def measure(name: str, operations_count: int, function: Callable[[], None]) -> None:
+    start_time = time.perf_counter()
+    function()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f'{name:<20} {elapsed_time:8.3f} s {operations_count / elapsed_time / 1e6:8.2f} M ops/s')
+
+
+def run_operations(put: Callable[[int], None],
+                   get: Callable[[], int],
+                   *,
+                   rounds_count: int,
+                   batch_size: int) -> None:
+    for i in range(rounds_count):
+        for value in range(batch_size):
+            put(value)
+
+        for value in range(batch_size):
+            get()
+
+
+def main() -> None:
+    operations_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    batch_size = 10000
+    rounds_count = operations_count // (batch_size * 2)
+
+    queue = j.Queue()
+    unrolled_queue = j_unrolled.UnrolledQueue()
+    collections_deque: collections.deque[int] = collections.deque()
+
+    measure('Queue', operations_count, lambda: run_operations(
+        queue.put,
+        queue.get,
+        rounds_count=rounds_count,
+        batch_size=batch_size,
+    ))
+    measure('UnrolledQueue', operations_count, lambda: run_operations(
+        unrolled_queue.put,
+        unrolled_queue.get,
+        rounds_count=rounds_count,
+        batch_size=batch_size,
+    ))
+    measure('collections.deque', operations_count, lambda: run_operations(
+        collections_deque.append,
+        collections_deque.popleft,
+        rounds_count=rounds_count,
+        batch_size=batch_size,
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import array
+import bisect
+import mmap
+import sys
+from collections.abc import Iterable, Sequence
+from typing import Self
+
+INT64_SIZE = 8
+
+
+class SavingsTimeline:
+    block_size: int
+
+    days: Sequence[int]
+    block_index: Sequence[int]
+
+    _mmap: mmap.mmap | None
+
+    def __init__(self, days: Sequence[int], *, block_size: int = 4096) -> None:
+        self.block_size = block_size
+
+        self.days = days
+        self.block_index = array.array('q', days[::block_size])
+
+        self._mmap = None
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._mmap is None:
+            return
+
+        if isinstance(self.days, memoryview):
+            self.days.release()
+
+        self.days = array.array('q')
+        self._mmap.close()
+        self._mmap = None
+
+    def find_day_of_purchase(self, price: int) -> int:
+        return self._find_day_of_purchase(price, lo=0)
+
+    def find_days_of_purchase(self, prices: Iterable[int]) -> Sequence[int]:
+        prices_list = list(prices)
+        result = [0] * len(prices_list)
+
+        # Запросы обрабатываются в порядке возрастания цены, поэтому каждый следующий поиск
+        # начинается с позиции, найденной для предыдущего.
+        lo = 0
+
+        for i in sorted(range(len(prices_list)), key=prices_list.__getitem__):
+            day_of_purchase = self._find_day_of_purchase(prices_list[i], lo=lo)
+            result[i] = day_of_purchase
+
+            if day_of_purchase == -1:
+                lo = len(self.days)
+            else:
+                lo = day_of_purchase - 1
+
+        return result
+
+    def _find_day_of_purchase(self, price: int, *, lo: int) -> int:
+        days_count = len(self.days)
+
+        block_num = bisect.bisect_left(self.block_index, price, lo=lo // self.block_size)
+        block_start = max((block_num - 1) * self.block_size, lo)
+        block_end = min(block_num * self.block_size + 1, days_count)
+
+        if block_start >= block_end:
+            return -1
+
+        day_of_purchase = bisect.bisect_left(self.days, price, lo=block_start, hi=block_end)
+
+        if day_of_purchase == days_count:
+            return -1
+
+        return day_of_purchase + 1
+
+    @classmethod
+    def open(cls, path: str, *, block_size: int = 4096) -> Self:
+        with open(path, 'rb') as timeline_file:
+            file_size = timeline_file.seek(0, 2)
+
+            if file_size == 0:
+                return cls(array.array('q'), block_size=block_size)
+
+            if file_size % INT64_SIZE:
+                raise ValueError('Invalid timeline file size')
+
+            timeline_mmap = mmap.mmap(timeline_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        timeline = cls(memoryview(timeline_mmap).cast('q'), block_size=block_size)
+        timeline._mmap = timeline_mmap
+
+        return timeline
+
+
+def write_savings_timeline(path: str, savings_timeline: Iterable[int]) -> None:
+    with open(path, 'wb') as timeline_file:
+        array.array('q', savings_timeline).tofile(timeline_file)
+
+
+def main() -> None:
+    tokens = sys.stdin.buffer.read().split()
+    timeline_path = tokens[0].decode()
+    prices_count = int(tokens[1])
+    prices = list(map(int, tokens[2:prices_count + 2]))
+
+    with SavingsTimeline.open(timeline_path) as timeline:
+        days_of_purchase = timeline.find_days_of_purchase([
+            price * factor
+            for price in prices
+            for factor in (1, 2)
+        ])
+
+    sys.stdout.write(''.join(
+        f'{days_of_purchase[i]} {days_of_purchase[i + 1]}\n'
+        for i in range(0, len(days_of_purchase), 2)
+    ))
+
+
+if __name__ == '__main__':
+    main()
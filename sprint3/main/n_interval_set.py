@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import bisect
+import sys
+from collections.abc import Iterable, Iterator
+from typing import Self
+
+type Interval = tuple[int, int]
+
+
+class IntervalSet:
+    # Интервалы хранятся в двух параллельных отсортированных массивах левых и правых концов. Соседние
+    # интервалы не пересекаются и не касаются друг друга, поэтому оба массива строго возрастают, и поиск
+    # нужной позиции в любом из них выполняется двоичным поиском.
+    left_endpoints: list[int]
+    right_endpoints: list[int]
+
+    def __init__(self) -> None:
+        self.left_endpoints = []
+        self.right_endpoints = []
+
+    def __len__(self) -> int:
+        return len(self.left_endpoints)
+
+    def __bool__(self) -> bool:
+        return bool(self.left_endpoints)
+
+    def add(self, left_endpoint: int, right_endpoint: int) -> None:
+        if left_endpoint > right_endpoint:
+            raise ValueError('Invalid interval')
+
+        start = bisect.bisect_left(self.right_endpoints, left_endpoint)
+        stop = bisect.bisect_right(self.left_endpoints, right_endpoint, lo=start)
+
+        if start < stop:
+            left_endpoint = min(left_endpoint, self.left_endpoints[start])
+            right_endpoint = max(right_endpoint, self.right_endpoints[stop - 1])
+
+        self.left_endpoints[start:stop] = [left_endpoint]
+        self.right_endpoints[start:stop] = [right_endpoint]
+
+    def remove(self, left_endpoint: int, right_endpoint: int) -> None:
+        if left_endpoint > right_endpoint:
+            raise ValueError('Invalid interval')
+
+        if left_endpoint == right_endpoint:
+            return
+
+        start = bisect.bisect_right(self.right_endpoints, left_endpoint)
+        stop = bisect.bisect_left(self.left_endpoints, right_endpoint, lo=start)
+
+        if start >= stop:
+            return
+
+        new_left_endpoints: list[int] = []
+        new_right_endpoints: list[int] = []
+
+        if self.left_endpoints[start] < left_endpoint:
+            new_left_endpoints.append(self.left_endpoints[start])
+            new_right_endpoints.append(left_endpoint)
+
+        if self.right_endpoints[stop - 1] > right_endpoint:
+            new_left_endpoints.append(right_endpoint)
+            new_right_endpoints.append(self.right_endpoints[stop - 1])
+
+        self.left_endpoints[start:stop] = new_left_endpoints
+        self.right_endpoints[start:stop] = new_right_endpoints
+
+    def covers(self, point: int) -> bool:
+        index = bisect.bisect_right(self.left_endpoints, point) - 1
+
+        if index < 0:
+            return False
+
+        return point < self.right_endpoints[index]
+
+    def iter_merged(self) -> Iterator[Interval]:
+        return zip(self.left_endpoints, self.right_endpoints)
+
+    @classmethod
+    def from_intervals(cls, intervals: Iterable[Interval]) -> Self:
+        # Начальное заполнение выполняется так же, как в `merge_intervals()`: интервалы сортируются
+        # один раз и объединяются за один проход, без двоичного поиска для каждого из них.
+        interval_set = cls()
+        intervals_list = sorted(intervals)
+
+        if not intervals_list:
+            return interval_set
+
+        left_endpoints = interval_set.left_endpoints
+        right_endpoints = interval_set.right_endpoints
+        previous_left_endpoint, previous_right_endpoint = intervals_list[0]
+
+        for left_endpoint, right_endpoint in intervals_list:
+            if left_endpoint <= previous_right_endpoint:
+                previous_right_endpoint = max(right_endpoint, previous_right_endpoint)
+                continue
+
+            left_endpoints.append(previous_left_endpoint)
+            right_endpoints.append(previous_right_endpoint)
+
+            previous_left_endpoint = left_endpoint
+            previous_right_endpoint = right_endpoint
+
+        left_endpoints.append(previous_left_endpoint)
+        right_endpoints.append(previous_right_endpoint)
+
+        return interval_set
+
+    @classmethod
+    def read(cls) -> Self:
+        return cls.from_intervals(read_intervals_buffered())
+
+
+def read_intervals_buffered() -> Iterable[Interval]:
+    tokens = sys.stdin.buffer.read().split()
+
+    if not tokens:
+        return []
+
+    intervals_count = int(tokens[0])
+    endpoints = list(map(int, tokens[1:intervals_count * 2 + 1]))
+
+    return zip(endpoints[0::2], endpoints[1::2])
+
+
+def main() -> None:
+    interval_set = IntervalSet.read()
+
+    sys.stdout.write(''.join(
+        f'{left_endpoint} {right_endpoint}\n'
+        for left_endpoint, right_endpoint in interval_set.iter_merged()
+    ))
+
+
+if __name__ == '__main__':
+    main()
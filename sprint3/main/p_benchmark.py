@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import array
+import io
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+import p
+import p_streaming
+
+
+def generate_values(values_count: int, *, max_block_size: int = 16) -> Sequence[int]:
+    values = list(range(values_count))
+    i = 0
+
+    while i < values_count:
+        block_size = random.randint(1, max_block_size)
+        block = values[i:i + block_size]
+        random.shuffle(block)
+        values[i:i + block_size] = block
+        i += block_size
+
+    return values
+
+
+def measure(name: str, values_count: int, function: Callable[[], int]) -> None:
+    start_time = time.perf_counter()
+    blocks_count = function()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f'{name:<24} {elapsed_time:8.3f} s {values_count / elapsed_time / 1e6:8.2f} M values/s '
+          f'(blocks: {blocks_count})')
+
+
+def main() -> None:
+    values_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    values = generate_values(values_count)
+
+    text_data = ' '.join(map(str, values)).encode()
+    binary_data = array.array('q', values).tobytes()
+
+    measure('get_blocks_count (text)', values_count, lambda: p.get_blocks_count(
+        list(map(int, text_data.split())),
+    ))
+    measure('streaming (text)', values_count, lambda: p_streaming.get_blocks_count(
+        p_streaming.read_text_chunks(io.BytesIO(text_data)),
+    ))
+    measure('streaming (binary)', values_count, lambda: p_streaming.get_blocks_count(
+        p_streaming.read_binary_chunks(io.BytesIO(binary_data)),
+    ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import array
+import itertools
+import operator
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from typing import BinaryIO
+
+CHUNK_SIZE = 1 << 20
+
+
+def iter_block_ends(chunks: Iterable[Sequence[int]]) -> Iterator[int]:
+    offset = 0
+    balance = 0
+
+    for chunk in chunks:
+        chunk_length = len(chunk)
+        balances = list(itertools.accumulate(
+            map(operator.sub, chunk, range(offset, offset + chunk_length)),
+            initial=balance,
+        ))
+        position = 1
+
+        while True:
+            try:
+                position = balances.index(0, position)
+            except ValueError:
+                break
+
+            yield offset + position - 1
+            position += 1
+
+        offset += chunk_length
+        balance = balances[-1]
+
+
+def get_blocks_count(chunks: Iterable[Sequence[int]]) -> int:
+    return sum(1 for _ in iter_block_ends(chunks))
+
+
+def read_text_chunks(stream: BinaryIO, *, chunk_size: int = CHUNK_SIZE) -> Iterator[Sequence[int]]:
+    tail = b''
+
+    while True:
+        data = stream.read(chunk_size)
+
+        if not data:
+            break
+
+        tokens = (tail + data).split()
+
+        if not tokens:
+            tail = b''
+            continue
+
+        if data[-1:].isspace():
+            tail = b''
+        else:
+            tail = tokens.pop()
+
+        if tokens:
+            yield list(map(int, tokens))
+
+    if tail:
+        yield [int(tail)]
+
+
+def read_binary_chunks(stream: BinaryIO, *, chunk_size: int = CHUNK_SIZE) -> Iterator[Sequence[int]]:
+    items_per_chunk = max(chunk_size // 8, 1)
+
+    while True:
+        chunk = array.array('q')
+
+        try:
+            chunk.fromfile(stream, items_per_chunk)
+        except EOFError:
+            pass
+
+        if not chunk:
+            break
+
+        yield chunk
+
+        if len(chunk) < items_per_chunk:
+            break
+
+
+def main() -> None:
+    values_count = int(sys.stdin.buffer.readline().strip())
+    chunks = read_text_chunks(sys.stdin.buffer)
+
+    blocks_count = sum(1 for block_end in iter_block_ends(chunks) if block_end < values_count)
+    print(blocks_count)
+
+
+if __name__ == '__main__':
+    main()
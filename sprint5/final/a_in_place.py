@@ -0,0 +1,301 @@
+# -- Принцип работы --
+#
+# Вариант пирамидальной сортировки из `a.py`, который не создает ни отдельной кучи, ни массива для
+# результата, а упорядочивает элементы на месте.
+#
+# * Сначала массив превращается в невозрастающую кучу (max-heap) методом Флойда: элементы просеиваются
+#   вниз, начиная с последнего узла, у которого есть потомки, и заканчивая корнем.
+# * Затем корень кучи, то есть максимальный элемент, меняется местами с последним элементом кучи.
+#   Размер кучи уменьшается на единицу, а новый корень просеивается вниз. Так максимальные элементы
+#   по очереди занимают свои места в конце массива.
+#
+# При просеивании вниз элементы не меняются местами попарно. Просеиваемый элемент запоминается, а
+# на его месте остается «дыра», в которую поднимается больший из потомков. Дыра опускается до тех пор,
+# пока просеиваемый элемент не окажется не меньше обоих потомков, после чего он записывается в дыру.
+# Это вдвое сокращает число записей в массив.
+#
+# Для планировщиков также реализована индексированная куча `IndexedHeap`. При добавлении каждый
+# элемент получает целочисленный дескриптор, а куча хранит позицию каждого дескриптора в массиве. Это
+# позволяет уменьшать ключ (`decrease_key()`) и удалять (`remove()`) произвольный элемент по его
+# дескриптору. Дескриптор уже удаленного элемента становится недействительным, даже если его ячейку
+# занял новый элемент.
+#
+# -- Доказательство корректности --
+#
+# После построения кучи методом Флойда каждый узел не меньше своих потомков: узлы обрабатываются снизу
+# вверх, поэтому к моменту просеивания узла оба его поддерева уже являются кучами. На каждом шаге
+# второго этапа корень кучи — максимальный из оставшихся элементов, и он помещается непосредственно
+# перед уже отсортированным хвостом массива, все элементы которого не меньше его. Следовательно, после
+# завершения алгоритма массив отсортирован по неубыванию.
+#
+# -- Временная сложность --
+#
+# Построение кучи методом Флойда выполняется за `O(n)`, а `n - 1` просеиваний вниз — за `O(n log n)`.
+# Операции индексированной кучи выполняются за `O(log n)`.
+#
+# -- Пространственная сложность --
+#
+# Сортировка выполняется на месте и использует `O(1)` дополнительной памяти. Индексированная куча
+# занимает `O(n)` памяти.
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Iterable, MutableSequence, Sequence
+from typing import Protocol, Self
+
+HANDLE_SLOT_BITS = 32
+HANDLE_SLOT_MASK = (1 << HANDLE_SLOT_BITS) - 1
+
+
+class Comparable(Protocol):
+    def __lt__(self, other: Self) -> bool: ...
+
+
+def heapsort[T: Comparable](array: Sequence[T]) -> Sequence[T]:
+    result = list(array)
+    heapsort_in_place(result)
+    return result
+
+
+def heapsort_in_place[T: Comparable](nodes: MutableSequence[T]) -> None:
+    nodes_count = len(nodes)
+
+    for index in range(nodes_count // 2 - 1, -1, -1):
+        _sift_down_max(nodes, index, nodes_count)
+
+    for last_index in range(nodes_count - 1, 0, -1):
+        nodes[0], nodes[last_index] = nodes[last_index], nodes[0]
+        _sift_down_max(nodes, 0, last_index)
+
+
+def _sift_down_max[T: Comparable](nodes: MutableSequence[T], index: int, size: int) -> None:
+    node = nodes[index]
+
+    while True:
+        child_index = index * 2 + 1
+
+        if child_index >= size:
+            break
+
+        right_child_index = child_index + 1
+
+        if right_child_index < size and nodes[child_index] < nodes[right_child_index]:
+            child_index = right_child_index
+
+        if not node < nodes[child_index]:
+            break
+
+        nodes[index] = nodes[child_index]
+        index = child_index
+
+    nodes[index] = node
+
+
+class IndexedHeap[T: Comparable]:
+    # Для каждой ячейки хранятся позиция ее элемента в массиве и поколение, которое увеличивается при
+    # освобождении ячейки. Дескриптор содержит номер ячейки и поколение, поэтому дескриптор удаленного
+    # элемента не подходит к новому элементу, занявшему ту же ячейку.
+    nodes: list[T]
+    slots: list[int]
+    positions: list[int]
+    generations: list[int]
+    free_slots: list[int]
+
+    def __init__(self, nodes: Iterable[T] = ()) -> None:
+        self.nodes = list(nodes)
+        self.slots = list(range(len(self.nodes)))
+        self.positions = list(range(len(self.nodes)))
+        self.generations = [0] * len(self.nodes)
+        self.free_slots = []
+
+        for index in range(len(self.nodes) // 2 - 1, -1, -1):
+            self._sift_down(index)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __bool__(self) -> bool:
+        return bool(self.nodes)
+
+    def __contains__(self, handle: int) -> bool:
+        slot = handle & HANDLE_SLOT_MASK
+
+        return (
+                handle >= 0 and
+                slot < len(self.positions) and
+                self.generations[slot] == handle >> HANDLE_SLOT_BITS and
+                self.positions[slot] >= 0
+        )
+
+    def __getitem__(self, handle: int) -> T:
+        return self.nodes[self._get_position(handle)]
+
+    def push(self, node: T) -> int:
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            slot = len(self.positions)
+            self.positions.append(-1)
+            self.generations.append(0)
+
+        self.nodes.append(node)
+        self.slots.append(slot)
+        self.positions[slot] = len(self.nodes) - 1
+        self._sift_up(len(self.nodes) - 1)
+
+        return self.generations[slot] << HANDLE_SLOT_BITS | slot
+
+    def peek(self) -> T:
+        if not self.nodes:
+            raise ValueError('Heap is empty')
+
+        return self.nodes[0]
+
+    def pop(self) -> T:
+        if not self.nodes:
+            raise ValueError('Heap is empty')
+
+        return self._remove_at(0)
+
+    def decrease_key(self, handle: int, node: T) -> None:
+        index = self._get_position(handle)
+
+        if self.nodes[index] < node:
+            raise ValueError('New key is greater than current key')
+
+        self.nodes[index] = node
+        self._sift_up(index)
+
+    def remove(self, handle: int) -> T:
+        return self._remove_at(self._get_position(handle))
+
+    def _get_position(self, handle: int) -> int:
+        if handle not in self:
+            raise ValueError('Invalid heap handle')
+
+        return self.positions[handle & HANDLE_SLOT_MASK]
+
+    def _remove_at(self, index: int) -> T:
+        node = self.nodes[index]
+        slot = self.slots[index]
+
+        last_node = self.nodes.pop()
+        last_slot = self.slots.pop()
+
+        if index < len(self.nodes):
+            self.nodes[index] = last_node
+            self.slots[index] = last_slot
+            self.positions[last_slot] = index
+
+            if last_node < node:
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+
+        self.positions[slot] = -1
+        self.generations[slot] += 1
+        self.free_slots.append(slot)
+
+        return node
+
+    def _sift_up(self, index: int) -> None:
+        nodes = self.nodes
+        slots = self.slots
+        positions = self.positions
+
+        node = nodes[index]
+        slot = slots[index]
+
+        while index > 0:
+            parent_index = (index - 1) // 2
+
+            if not node < nodes[parent_index]:
+                break
+
+            nodes[index] = nodes[parent_index]
+            slots[index] = slots[parent_index]
+            positions[slots[index]] = index
+            index = parent_index
+
+        nodes[index] = node
+        slots[index] = slot
+        positions[slot] = index
+
+    def _sift_down(self, index: int) -> None:
+        nodes = self.nodes
+        slots = self.slots
+        positions = self.positions
+        size = len(nodes)
+
+        node = nodes[index]
+        slot = slots[index]
+
+        while True:
+            child_index = index * 2 + 1
+
+            if child_index >= size:
+                break
+
+            right_child_index = child_index + 1
+
+            if right_child_index < size and nodes[right_child_index] < nodes[child_index]:
+                child_index = right_child_index
+
+            if not nodes[child_index] < node:
+                break
+
+            nodes[index] = nodes[child_index]
+            slots[index] = slots[child_index]
+            positions[slots[index]] = index
+            index = child_index
+
+        nodes[index] = node
+        slots[index] = slot
+        positions[slot] = index
+
+
+@dataclasses.dataclass(kw_only=True)
+class Participant(Comparable):
+    name: str
+    score: int
+    penalty: int
+
+    def __lt__(self, other: Self) -> bool:
+        return self.get_comparison_key() < other.get_comparison_key()
+
+    def get_comparison_key(self) -> Comparable:
+        return (
+            -self.score,
+            self.penalty,
+            self.name,
+        )
+
+    @classmethod
+    def read(cls) -> Self:
+        fields_list = input().split()
+
+        return cls(
+            name=fields_list[0],
+            score=int(fields_list[1]),
+            penalty=int(fields_list[2]),
+        )
+
+    @classmethod
+    def read_list(cls, count: int) -> Iterable[Self]:
+        for i in range(count):
+            yield cls.read()
+
+
+def main() -> None:
+    participants_count = int(input().strip())
+    participants = list(Participant.read_list(participants_count))
+
+    heapsort_in_place(participants)
+
+    for participant in participants:
+        print(participant.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import heapq
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+import a
+import a_in_place
+
+
+def measure(name: str, items_count: int, function: Callable[[], Sequence[int]]) -> Sequence[int]:
+    start_time = time.perf_counter()
+    result = function()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f'{name:<36} {elapsed_time:8.3f} s {items_count / elapsed_time / 1e6:8.2f} M items/s')
+
+    return result
+
+
+def heapq_sort(items: Sequence[int]) -> Sequence[int]:
+    heap = list(items)
+    heapq.heapify(heap)
+    return [heapq.heappop(heap) for _ in range(len(heap))]
+
+
+def in_place_sort(items: Sequence[int]) -> Sequence[int]:
+    result = list(items)
+    a_in_place.heapsort_in_place(result)
+    return result
+
+
+def indexed_heap_sort(items: Sequence[int]) -> Sequence[int]:
+    heap = a_in_place.IndexedHeap(items)
+    return [heap.pop() for _ in range(len(heap))]
+
+
+def run_decrease_keys(items: Sequence[int]) -> Sequence[int]:
+    heap = a_in_place.IndexedHeap[int]()
+    handles = [heap.push(item) for item in items]
+
+    for handle in handles[::2]:
+        heap.decrease_key(handle, heap[handle] - random.randint(0, 10 ** 6))
+
+    for handle in handles[1::4]:
+        heap.remove(handle)
+
+    return [heap.pop() for _ in range(len(heap))]
+
+
+def main() -> None:
+    items_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 5
+    items = [random.randint(-10 ** 9, 10 ** 9) for _ in range(items_count)]
+
+    result_sorted = measure('sorted()', items_count, lambda: sorted(items))
+    result_heapq = measure('heapq.heapify() + heappop()', items_count, lambda: heapq_sort(items))
+    result_heap = measure('a.heapsort()', items_count, lambda: a.heapsort(items))
+    result_in_place = measure('a_in_place.heapsort_in_place()', items_count, lambda: in_place_sort(items))
+    result_indexed = measure('a_in_place.IndexedHeap', items_count, lambda: indexed_heap_sort(items))
+
+    assert (
+            result_sorted ==
+            result_heapq ==
+            list(result_heap) ==
+            result_in_place ==
+            result_indexed
+    )
+
+    measure('IndexedHeap decrease_key/remove', items_count, lambda: run_decrease_keys(items))
+
+
+if __name__ == '__main__':
+    main()
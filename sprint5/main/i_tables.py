@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import array
+import functools
+import math
+import sys
+from collections.abc import Callable, Iterable, Sequence
+from typing import Self
+
+
+class CatalanEngine:
+    module: int | None
+
+    # Таблицы факториалов и обратных факториалов используются при вычислениях по модулю.
+    factorials: array.array[int]
+    inverse_factorials: array.array[int]
+
+    # Точные значения небольших чисел Каталана хранятся целиком, а для больших `n` используется кеш.
+    catalan_numbers: list[int]
+    exact_table_limit: int
+    catalan_exact_cached: Callable[[int], int]
+
+    def __init__(self,
+                 *,
+                 module: int | None = None,
+                 max_n: int = 0,
+                 exact_table_limit: int = 1 << 12,
+                 cache_size: int | None = 1 << 10) -> None:
+        self.module = module
+
+        self.factorials = array.array('q', [1])
+        self.inverse_factorials = array.array('q', [1])
+
+        self.catalan_numbers = [1]
+        self.exact_table_limit = exact_table_limit
+        self.catalan_exact_cached = functools.lru_cache(maxsize=cache_size)(self._get_catalan_exact)
+
+        self.ensure(max_n)
+
+    def ensure(self, max_n: int) -> None:
+        if self.module is None:
+            self._extend_catalan_numbers(min(max_n, self.exact_table_limit))
+        else:
+            self._extend_factorials(max(2 * max_n, max_n + 1))
+
+    def catalan(self, n: int) -> int:
+        if n < 0:
+            raise ValueError('Catalan number index must be non-negative')
+
+        if self.module is None:
+            if n <= self.exact_table_limit:
+                self._extend_catalan_numbers(n)
+                return self.catalan_numbers[n]
+
+            return self.catalan_exact_cached(n)
+
+        self._extend_factorials(max(2 * n, n + 1))
+
+        return (
+                self.factorials[2 * n] *
+                self.inverse_factorials[n] % self.module *
+                self.inverse_factorials[n + 1] % self.module
+        )
+
+    def catalan_many(self, ns: Iterable[int]) -> Sequence[int]:
+        ns_list = list(ns)
+        self.ensure(max(ns_list, default=0))
+
+        return list(map(self.catalan, ns_list))
+
+    def binomial(self, n: int, k: int) -> int:
+        if not 0 <= k <= n:
+            return 0
+
+        if self.module is None:
+            return math.comb(n, k)
+
+        self._extend_factorials(n)
+
+        return (
+                self.factorials[n] *
+                self.inverse_factorials[k] % self.module *
+                self.inverse_factorials[n - k] % self.module
+        )
+
+    def save(self, path: str) -> None:
+        if self.module is None:
+            raise ValueError('Only modular tables can be saved')
+
+        with open(path, 'wb') as tables_file:
+            array.array('q', [self.module, len(self.factorials)]).tofile(tables_file)
+            self.factorials.tofile(tables_file)
+            self.inverse_factorials.tofile(tables_file)
+
+    @classmethod
+    def load(cls, path: str) -> Self:
+        header = array.array('q')
+
+        with open(path, 'rb') as tables_file:
+            header.fromfile(tables_file, 2)
+            module, tables_size = header
+
+            engine = cls(module=module)
+            engine.factorials = array.array('q')
+            engine.factorials.fromfile(tables_file, tables_size)
+            engine.inverse_factorials = array.array('q')
+            engine.inverse_factorials.fromfile(tables_file, tables_size)
+
+        return engine
+
+    def _extend_factorials(self, max_value: int) -> None:
+        assert self.module is not None
+
+        old_size = len(self.factorials)
+
+        if max_value < old_size:
+            return
+
+        if max_value >= self.module:
+            raise ValueError('Module is too small')
+
+        # Таблицы растут как минимум вдвое, чтобы серия запросов с возрастающими `n` не пересчитывала
+        # их каждый раз.
+        new_size = min(max(max_value + 1, 2 * old_size), self.module)
+        module = self.module
+        factorials = self.factorials
+        factorial = factorials[-1]
+
+        for i in range(old_size, new_size):
+            factorial = factorial * i % module
+            factorials.append(factorial)
+
+        inverse_factorial = pow(factorial, -1, module)
+        new_inverse_factorials = array.array('q', [inverse_factorial])
+
+        for i in range(new_size - 1, old_size, -1):
+            inverse_factorial = inverse_factorial * i % module
+            new_inverse_factorials.append(inverse_factorial)
+
+        new_inverse_factorials.reverse()
+        self.inverse_factorials.extend(new_inverse_factorials)
+
+    def _extend_catalan_numbers(self, max_n: int) -> None:
+        catalan_numbers = self.catalan_numbers
+        catalan_number = catalan_numbers[-1]
+
+        for n in range(len(catalan_numbers) - 1, max_n):
+            catalan_number = catalan_number * 2 * (2 * n + 1) // (n + 2)
+            catalan_numbers.append(catalan_number)
+
+    @staticmethod
+    def _get_catalan_exact(n: int) -> int:
+        return math.comb(2 * n, n) // (n + 1)
+
+
+def get_unique_bst_count(n: int) -> int:
+    return CatalanEngine().catalan(n)
+
+
+def main() -> None:
+    ns = list(map(int, sys.stdin.buffer.read().split()))
+    engine = CatalanEngine()
+
+    sys.stdout.write(''.join(f'{catalan_number}\n' for catalan_number in engine.catalan_many(ns)))
+
+
+if __name__ == '__main__':
+    main()
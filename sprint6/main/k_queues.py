@@ -0,0 +1,425 @@
+from __future__ import annotations
+
+import heapq
+import sys
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Protocol, Self
+
+HANDLE_SLOT_BITS = 32
+HANDLE_SLOT_MASK = (1 << HANDLE_SLOT_BITS) - 1
+
+
+class Comparable(Protocol):
+    def __lt__(self, other: Self) -> bool: ...
+
+
+class PriorityQueue[T, H](Protocol):
+    def __len__(self) -> int: ...
+
+    def __bool__(self) -> bool: ...
+
+    def push(self, item: T, priority: Comparable) -> H: ...
+
+    def peek(self) -> tuple[T, Comparable]: ...
+
+    def pop(self) -> tuple[T, Comparable]: ...
+
+    def decrease_key(self, handle: H, priority: Comparable) -> None: ...
+
+
+class DaryHeap[T]:
+    # Элементы кучи хранятся в параллельных списках. Для каждой ячейки хранится текущая позиция ее
+    # элемента в куче, а освободившиеся ячейки используются повторно. Дескриптор содержит номер ячейки
+    # и ее поколение, которое увеличивается при освобождении ячейки, поэтому дескриптор уже извлеченного
+    # элемента не подходит к новому элементу в той же ячейке.
+    arity: int
+    priorities: list[Any]
+    items: list[T]
+    slots: list[int]
+    positions: list[int]
+    generations: list[int]
+    free_slots: list[int]
+
+    def __init__(self, *, arity: int = 2) -> None:
+        if arity < 2:
+            raise ValueError('Heap arity must be at least 2')
+
+        self.arity = arity
+        self.priorities = []
+        self.items = []
+        self.slots = []
+        self.positions = []
+        self.generations = []
+        self.free_slots = []
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def push(self, item: T, priority: Comparable) -> int:
+        if self.free_slots:
+            slot = self.free_slots.pop()
+        else:
+            slot = len(self.positions)
+            self.positions.append(-1)
+            self.generations.append(0)
+
+        self.priorities.append(priority)
+        self.items.append(item)
+        self.slots.append(slot)
+        self._sift_up(len(self.items) - 1)
+
+        return self.generations[slot] << HANDLE_SLOT_BITS | slot
+
+    def peek(self) -> tuple[T, Comparable]:
+        if not self.items:
+            raise ValueError('Heap is empty')
+
+        return self.items[0], self.priorities[0]
+
+    def pop(self) -> tuple[T, Comparable]:
+        if not self.items:
+            raise ValueError('Heap is empty')
+
+        item = self.items[0]
+        priority = self.priorities[0]
+        slot = self.slots[0]
+
+        last_item = self.items.pop()
+        last_priority = self.priorities.pop()
+        last_slot = self.slots.pop()
+
+        if self.items:
+            self.items[0] = last_item
+            self.priorities[0] = last_priority
+            self.slots[0] = last_slot
+            self._sift_down(0)
+
+        self.positions[slot] = -1
+        self.generations[slot] += 1
+        self.free_slots.append(slot)
+
+        return item, priority
+
+    def decrease_key(self, handle: int, priority: Comparable) -> None:
+        slot = handle & HANDLE_SLOT_MASK
+
+        if (
+                handle < 0 or
+                slot >= len(self.positions) or
+                self.generations[slot] != handle >> HANDLE_SLOT_BITS or
+                self.positions[slot] < 0
+        ):
+            raise ValueError('Invalid heap handle')
+
+        index = self.positions[slot]
+
+        if self.priorities[index] < priority:
+            raise ValueError('New key is greater than current key')
+
+        self.priorities[index] = priority
+        self._sift_up(index)
+
+    def _sift_up(self, index: int) -> None:
+        arity = self.arity
+        priorities = self.priorities
+        items = self.items
+        slots = self.slots
+        positions = self.positions
+
+        priority = priorities[index]
+        item = items[index]
+        slot = slots[index]
+
+        while index > 0:
+            parent_index = (index - 1) // arity
+
+            if not priority < priorities[parent_index]:
+                break
+
+            priorities[index] = priorities[parent_index]
+            items[index] = items[parent_index]
+            slots[index] = slots[parent_index]
+            positions[slots[index]] = index
+            index = parent_index
+
+        priorities[index] = priority
+        items[index] = item
+        slots[index] = slot
+        positions[slot] = index
+
+    def _sift_down(self, index: int) -> None:
+        arity = self.arity
+        priorities = self.priorities
+        items = self.items
+        slots = self.slots
+        positions = self.positions
+        size = len(items)
+
+        priority = priorities[index]
+        item = items[index]
+        slot = slots[index]
+
+        while True:
+            first_child_index = index * arity + 1
+
+            if first_child_index >= size:
+                break
+
+            smallest_child_index = first_child_index
+
+            for child_index in range(first_child_index + 1, min(first_child_index + arity, size)):
+                if priorities[child_index] < priorities[smallest_child_index]:
+                    smallest_child_index = child_index
+
+            if not priorities[smallest_child_index] < priority:
+                break
+
+            priorities[index] = priorities[smallest_child_index]
+            items[index] = items[smallest_child_index]
+            slots[index] = slots[smallest_child_index]
+            positions[slots[index]] = index
+            index = smallest_child_index
+
+        priorities[index] = priority
+        items[index] = item
+        slots[index] = slot
+        positions[slot] = index
+
+
+class BinaryHeap[T](DaryHeap[T]):
+    def __init__(self) -> None:
+        super().__init__(arity=2)
+
+
+class QuaternaryHeap[T](DaryHeap[T]):
+    def __init__(self) -> None:
+        super().__init__(arity=4)
+
+
+class PairingHeapNode[T]:
+    item: T
+    priority: Any
+    child: PairingHeapNode[T] | None
+    sibling: PairingHeapNode[T] | None
+    # Для самого левого потомка — ссылка на родителя, для остальных — на левого брата.
+    prev: PairingHeapNode[T] | None
+    # Куча, в которой находится узел. После извлечения узла ссылка сбрасывается.
+    heap: PairingHeap[T] | None
+
+    def __init__(self, item: T, priority: Comparable, *, heap: PairingHeap[T]) -> None:
+        self.item = item
+        self.priority = priority
+        self.child = self.sibling = self.prev = None
+        self.heap = heap
+
+
+class PairingHeap[T]:
+    root: PairingHeapNode[T] | None
+    size: int
+
+    def __init__(self) -> None:
+        self.root = None
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        return self.root is not None
+
+    def push(self, item: T, priority: Comparable) -> PairingHeapNode[T]:
+        node = PairingHeapNode(item, priority, heap=self)
+        self.root = self._meld(self.root, node)
+        self.size += 1
+
+        return node
+
+    def peek(self) -> tuple[T, Comparable]:
+        if self.root is None:
+            raise ValueError('Heap is empty')
+
+        return self.root.item, self.root.priority
+
+    def pop(self) -> tuple[T, Comparable]:
+        root = self.root
+
+        if root is None:
+            raise ValueError('Heap is empty')
+
+        self.root = self._merge_pairs(root.child)
+        self.size -= 1
+
+        if self.root is not None:
+            self.root.prev = None
+
+        root.child = None
+        root.heap = None
+
+        return root.item, root.priority
+
+    def decrease_key(self, handle: PairingHeapNode[T], priority: Comparable) -> None:
+        if handle.heap is not self:
+            raise ValueError('Invalid heap handle')
+
+        if handle.priority < priority:
+            raise ValueError('New key is greater than current key')
+
+        handle.priority = priority
+
+        if handle is self.root:
+            return
+
+        # Узел вместе со своим поддеревом вырезается из списка братьев и сливается с корнем.
+        prev = handle.prev
+
+        if prev is None:
+            raise ValueError('Invalid heap handle')
+
+        if prev.child is handle:
+            prev.child = handle.sibling
+        else:
+            prev.sibling = handle.sibling
+
+        if handle.sibling is not None:
+            handle.sibling.prev = prev
+
+        handle.sibling = handle.prev = None
+        self.root = self._meld(self.root, handle)
+
+    @staticmethod
+    def _meld(first: PairingHeapNode[T] | None, second: PairingHeapNode[T] | None) -> PairingHeapNode[T] | None:
+        if first is None:
+            return second
+
+        if second is None:
+            return first
+
+        if second.priority < first.priority:
+            first, second = second, first
+
+        second.prev = first
+        second.sibling = first.child
+
+        if first.child is not None:
+            first.child.prev = second
+
+        first.child = second
+
+        return first
+
+    @classmethod
+    def _merge_pairs(cls, node: PairingHeapNode[T] | None) -> PairingHeapNode[T] | None:
+        # Первый проход сливает соседние пары слева направо, второй — полученные кучи справа налево.
+        pairs: list[PairingHeapNode[T]] = []
+
+        while node is not None:
+            first = node
+            second = node.sibling
+            node = second.sibling if second is not None else None
+
+            first.sibling = first.prev = None
+
+            if second is not None:
+                second.sibling = second.prev = None
+
+            melded = cls._meld(first, second)
+            assert melded is not None
+            pairs.append(melded)
+
+        result: PairingHeapNode[T] | None = None
+
+        while pairs:
+            result = cls._meld(pairs.pop(), result)
+
+        return result
+
+
+type AdjacencyLists = Sequence[Iterable[tuple[int, int]]]
+type QueueFactory = Callable[[], PriorityQueue[int, Any]]
+
+
+def get_distances(graph: AdjacencyLists, start_vertex: int, *, queue_factory: QueueFactory) -> Sequence[int | None]:
+    distances: list[int | None] = [None] * len(graph)
+    handles: list[Any] = [None] * len(graph)
+    queue = queue_factory()
+
+    distances[start_vertex] = 0
+    handles[start_vertex] = queue.push(start_vertex, 0)
+
+    while queue:
+        vertex, vertex_distance = queue.pop()
+        handles[vertex] = None
+
+        for neighbor, weight in graph[vertex]:
+            neighbor_distance = vertex_distance + weight
+            current_distance = distances[neighbor]
+
+            if current_distance is not None and current_distance <= neighbor_distance:
+                continue
+
+            distances[neighbor] = neighbor_distance
+
+            if handles[neighbor] is None:
+                handles[neighbor] = queue.push(neighbor, neighbor_distance)
+            else:
+                queue.decrease_key(handles[neighbor], neighbor_distance)
+
+    return distances
+
+
+def get_distances_lazy(graph: AdjacencyLists, start_vertex: int) -> Sequence[int | None]:
+    distances: list[int | None] = [None] * len(graph)
+    queue = [(0, start_vertex)]
+
+    distances[start_vertex] = 0
+
+    while queue:
+        vertex_distance, vertex = heapq.heappop(queue)
+
+        if vertex_distance != distances[vertex]:
+            continue
+
+        for neighbor, weight in graph[vertex]:
+            neighbor_distance = vertex_distance + weight
+            current_distance = distances[neighbor]
+
+            if current_distance is None or current_distance > neighbor_distance:
+                distances[neighbor] = neighbor_distance
+                heapq.heappush(queue, (neighbor_distance, neighbor))
+
+    return distances
+
+
+def read_graph(tokens: Sequence[bytes], *, vertices_count: int, edges_count: int) -> AdjacencyLists:
+    graph: list[list[tuple[int, int]]] = [[] for _i in range(vertices_count)]
+
+    for i in range(2, 2 + edges_count * 3, 3):
+        u = int(tokens[i]) - 1
+        v = int(tokens[i + 1]) - 1
+        weight = int(tokens[i + 2])
+
+        graph[u].append((v, weight))
+        graph[v].append((u, weight))
+
+    return graph
+
+
+def main() -> None:
+    tokens = sys.stdin.buffer.read().split()
+    vertices_count, edges_count = int(tokens[0]), int(tokens[1])
+    graph = read_graph(tokens, vertices_count=vertices_count, edges_count=edges_count)
+
+    sys.stdout.write(''.join(
+        ' '.join(
+            str(distance if distance is not None else -1)
+            for distance in get_distances(graph, start_vertex, queue_factory=QuaternaryHeap)
+        ) + '\n'
+        for start_vertex in range(vertices_count)
+    ))
+
+
+if __name__ == '__main__':
+    main()
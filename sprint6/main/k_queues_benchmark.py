@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+
+import k
+import k_queues
+
+
+def measure(name: str, runs_count: int, function: Callable[[], Sequence[int | None]]) -> Sequence[int | None]:
+    start_time = time.perf_counter()
+    result = function()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f'{name:<28} {elapsed_time:8.3f} s {elapsed_time / runs_count * 1e3:8.2f} ms/run')
+
+    return result
+
+
+def create_graph(vertices_count: int, edges_count: int) -> k.Graph:
+    graph = k.Graph(vertices_count=vertices_count, is_directed=False)
+
+    for i in range(1, vertices_count):
+        graph.add_edge(k.Edge([random.randrange(i), i], weight=random.randint(1, 100)))
+
+    for i in range(edges_count - vertices_count + 1):
+        graph.add_edge(k.Edge(
+            [random.randrange(vertices_count), random.randrange(vertices_count)],
+            weight=random.randint(1, 100),
+        ))
+
+    return graph
+
+
+def run_all(function: Callable[[int], Sequence[int | None]], start_vertices: Sequence[int]) -> Sequence[int | None]:
+    result: list[int | None] = []
+
+    for start_vertex in start_vertices:
+        result.extend(function(start_vertex))
+
+    return result
+
+
+def main() -> None:
+    vertices_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 4
+    edges_count = vertices_count * 8
+    runs_count = 10
+
+    graph = create_graph(vertices_count, edges_count)
+    start_vertices = [random.randrange(vertices_count) for _ in range(runs_count)]
+
+    print(f'vertices: {vertices_count}, edges: {edges_count}')
+
+    results = [
+        measure('k.Dijkstra (heapq)', runs_count, lambda: run_all(
+            graph.get_distances,
+            start_vertices,
+        )),
+        measure('lazy heapq', runs_count, lambda: run_all(
+            lambda start_vertex: k_queues.get_distances_lazy(graph, start_vertex),
+            start_vertices,
+        )),
+    ]
+
+    for queue_factory in [k_queues.BinaryHeap, k_queues.QuaternaryHeap, k_queues.PairingHeap]:
+        results.append(measure(queue_factory.__name__, runs_count, lambda: run_all(
+            lambda start_vertex: k_queues.get_distances(graph, start_vertex, queue_factory=queue_factory),
+            start_vertices,
+        )))
+
+    assert all(result == results[0] for result in results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping, Sequence
+
+type FibonacciPair = tuple[int, int]
+
+
+PISANO_MODULE_LIMIT = 10 ** 6
+
+
+class FibonacciEngine:
+    pisano_periods: dict[int, int]
+    pisano_module_limit: int
+
+    def __init__(self, *, pisano_module_limit: int = PISANO_MODULE_LIMIT) -> None:
+        self.pisano_periods = {}
+        self.pisano_module_limit = pisano_module_limit
+
+    def fibonacci(self, n: int, *, module: int | None = None) -> int:
+        # Индексация курса: F(0) = F(1) = 1, что соответствует классическому F(n + 1).
+        if n < 0:
+            raise ValueError('Invalid index')
+
+        if module is None:
+            return fibonacci_pair(n + 1)[0]
+
+        if module < 1:
+            raise ValueError('Invalid module')
+
+        return fibonacci_pair(self._reduce_index(n + 1, module), module=module)[0]
+
+    def fibonacci_many(self, ns: Iterable[int], *, module: int) -> Sequence[int]:
+        if module < 1:
+            raise ValueError('Invalid module')
+
+        ns_list = list(ns)
+
+        if any(n < 0 for n in ns_list):
+            raise ValueError('Invalid index')
+
+        indices = [self._reduce_index(n + 1, module) for n in ns_list]
+
+        # Пары (F(2^i), F(2^i + 1)) вычисляются один раз и используются для всех запросов.
+        power_pairs: list[FibonacciPair] = [(1 % module, 1 % module)]
+
+        for i in range(1, max(indices, default=0).bit_length()):
+            power_pairs.append(_double_pair(power_pairs[-1], module=module))
+
+        result: list[int] = []
+
+        for n in indices:
+            pair = (0, 1 % module)
+            bit = 0
+
+            while n:
+                if n & 1:
+                    pair = _add_pairs(pair, power_pairs[bit], module=module)
+
+                n >>= 1
+                bit += 1
+
+            result.append(pair[0])
+
+        return result
+
+    def get_pisano_period(self, module: int) -> int:
+        pisano_period = self.pisano_periods.get(module)
+
+        if pisano_period is None:
+            pisano_period = get_pisano_period(module)
+            self.pisano_periods[module] = pisano_period
+
+        return pisano_period
+
+    def _reduce_index(self, n: int, module: int) -> int:
+        # Период Пизано находится через разложение модуля на множители за `O(√m)`, поэтому индекс
+        # сокращается по периоду, только если период уже известен или модуль достаточно мал.
+        # Быстрое удвоение и без сокращения выполняется за `O(log n)`.
+        pisano_period = self.pisano_periods.get(module)
+
+        if pisano_period is None and module <= self.pisano_module_limit:
+            pisano_period = self.get_pisano_period(module)
+
+        if pisano_period is None:
+            return n
+
+        return n % pisano_period
+
+
+def fibonacci_pair(n: int, *, module: int | None = None) -> FibonacciPair:
+    # Возвращает пару (F(n), F(n + 1)) в классической индексации, F(0) = 0.
+    a, b = 0, 1
+
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+
+        if bit == '1':
+            a, b = d, c + d
+        else:
+            a, b = c, d
+
+        if module is not None:
+            a %= module
+            b %= module
+
+    if module is not None:
+        a %= module
+        b %= module
+
+    return a, b
+
+
+def get_pisano_period(module: int) -> int:
+    if module == 1:
+        return 1
+
+    period_factors: dict[int, int] = {}
+
+    for prime, power in factorize(module).items():
+        prime_period_multiple: int
+
+        if prime == 2:
+            prime_period_multiple = 3
+        elif prime == 5:
+            prime_period_multiple = 20
+        elif prime % 5 in (1, 4):
+            prime_period_multiple = prime - 1
+        else:
+            prime_period_multiple = 2 * (prime + 1)
+
+        for factor, factor_power in factorize(prime_period_multiple).items():
+            period_factors[factor] = max(period_factors.get(factor, 0), factor_power)
+
+        period_factors[prime] = max(period_factors.get(prime, 0), power - 1 + (1 if prime == 5 else 0))
+
+    period = math.prod(factor ** power for factor, power in period_factors.items())
+
+    for factor in period_factors:
+        while period % factor == 0 and fibonacci_pair(period // factor, module=module) == (0, 1):
+            period //= factor
+
+    return period
+
+
+def factorize(value: int) -> Mapping[int, int]:
+    result: dict[int, int] = {}
+    divisor = 2
+
+    while divisor * divisor <= value:
+        while value % divisor == 0:
+            result[divisor] = result.get(divisor, 0) + 1
+            value //= divisor
+
+        divisor += 1 if divisor == 2 else 2
+
+    if value > 1:
+        result[value] = result.get(value, 0) + 1
+
+    return result
+
+
+def _double_pair(pair: FibonacciPair, *, module: int) -> FibonacciPair:
+    a, b = pair
+    return a * (2 * b - a) % module, (a * a + b * b) % module
+
+
+def _add_pairs(pair_1: FibonacciPair, pair_2: FibonacciPair, *, module: int) -> FibonacciPair:
+    a, a_next = pair_1
+    b, b_next = pair_2
+    return (a * b_next + (a_next - a) * b) % module, (a_next * b_next + a * b) % module
+
+
+def main() -> None:
+    n = int(input().strip())
+    print(FibonacciEngine().fibonacci(n, module=10 ** 9 + 7))
+
+
+if __name__ == '__main__':
+    main()